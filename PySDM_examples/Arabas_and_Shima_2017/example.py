@@ -4,11 +4,11 @@ Created at 23.04.2020
 
 from PySDM_examples.Arabas_and_Shima_2017.settings import setups
 from PySDM_examples.Arabas_and_Shima_2017.simulation import Simulation
+from PySDM_examples.Arabas_and_Shima_2017.sweep import run_setups
 
 
 def main():
-    for settings in setups:
-        Simulation(settings).run()
+    run_setups(setups)
 
 
 if __name__ == '__main__':
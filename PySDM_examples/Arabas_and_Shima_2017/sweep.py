@@ -0,0 +1,46 @@
+"""
+Created at 18.10.2026
+"""
+
+import os
+from itertools import repeat
+from ..utils.process_pool import spawned_pool
+
+
+def _run_chunk(chunk, bdf):
+    from .simulation import Simulation
+    results = []
+    for index, settings in chunk:
+        simulation = Simulation(settings)
+        if bdf:
+            from PySDM.backends.numba import bdf as bdf_solver
+            bdf_solver.patch_core(simulation.core, settings.coord)
+        results.append((index, simulation.run()))
+    return results
+
+
+def run_setups(setups, max_workers: int = 1, bdf: bool = False) -> list:
+    """ runs the single-parcel `Simulation` of each of `setups` (one core per parcel) one after
+        another or, with `max_workers > 1`, spread over a pool of (at most `os.cpu_count()`)
+        spawned single-threaded processes, each taking an interleaved share of the setups so that
+        the JIT compilation is done once per worker; with `bdf`, the condensation solver is
+        replaced by the BDF one; returns the outputs in the order of `setups`
+        (parcels are not batched within one core: the `Parcel` environment of the PySDM version
+        used here is 0-D and condensation takes a single `dv` for all cells, so the per-step
+        overhead of each parcel remains - only spread over the cores) """
+    max_workers = max(1, min(max_workers, os.cpu_count() or 1, len(setups)))
+    chunks = [list(enumerate(setups))[i::max_workers] for i in range(max_workers)]
+
+    outputs = [None] * len(setups)
+
+    def collect(results):
+        for chunk_results in results:
+            for index, output in chunk_results:
+                outputs[index] = output
+
+    if max_workers == 1:
+        collect(_run_chunk(chunk, bdf) for chunk in chunks)
+    else:
+        with spawned_pool(max_workers, numba_threads=1) as executor:
+            collect(executor.map(_run_chunk, chunks, repeat(bdf)))
+    return outputs
@@ -0,0 +1,113 @@
+"""
+Created at 18.10.2026
+"""
+
+import time
+from queue import Queue
+from threading import Thread
+import numpy as np
+from .storage import Storage
+
+
+class AsyncStorage:
+    """ write-behind wrapper around `Storage`: `save()` only snapshots the data into a bounded queue
+        (blocking when it is full) while a worker thread does the serialisation """
+    Exception = Storage.Exception
+
+    def __init__(self, storage: Storage, queue_size: int = 64):
+        self.storage = storage
+        self.queue = Queue(maxsize=queue_size)
+        self.thread = None
+        self.error = None
+        self.io_time = 0
+        self.blocked_time = 0
+
+    @property
+    def dir_path(self):
+        return self.storage.dir_path
+
+    def init(self, settings):
+        self.flush()
+        self.storage.init(settings)
+        self._start()
+
+    def resume(self, settings, step: int):
+        self.flush()
+        self.storage.resume(settings, step)
+        self._start()
+
+    def _start(self):
+        self.error = None
+        self.io_time = 0
+        self.blocked_time = 0
+        self.thread = Thread(target=self._work, daemon=True)
+        self.thread.start()
+
+    def _put(self, method: str, *args):
+        if self.thread is None:
+            raise RuntimeError("AsyncStorage not initialised or already flushed (call init() or resume() first)")
+        if self.error is not None:
+            raise self.error
+        t0 = time.perf_counter()
+        self.queue.put((method, args))
+        self.blocked_time += time.perf_counter() - t0
+
+    def save(self, data: (float, np.ndarray), step: int, name: str):
+        self._put('save', data if isinstance(data, (int, float)) else np.copy(data), step, name)
+
+    def commit(self, step: int):
+        """ queued behind the preceding saves, so the manifest never gets ahead of the data """
+        self._put('commit', step)
+
+    def checkpoint(self, state, step: int):
+        """ queued as well, so a checkpoint is only ever written once its output step is stored """
+        self._put('checkpoint', state, step)
+
+    def flush(self):
+        """ waits for the queued writes and stops the worker; an error of any of them is raised (once) """
+        if self.thread is None:
+            return
+        t0 = time.perf_counter()
+        self.queue.put(None)
+        self.thread.join()
+        self.blocked_time += time.perf_counter() - t0
+        self.thread = None
+        self.storage.flush()
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def available(self, name: str, step: int = None) -> bool:
+        return self.storage.available(name, step)
+
+    def load(self, name: str, step: int = None) -> np.ndarray:
+        return self.storage.load(name, step)
+
+    def load_tail(self, name: str, start: int = 0) -> np.ndarray:
+        return self.storage.load_tail(name, start)
+
+    @property
+    def overlapped_time(self):
+        return max(0, self.io_time - self.blocked_time)
+
+    def report(self):
+        return {
+            'io_time': self.io_time,
+            'blocked_time': self.blocked_time,
+            'overlapped_time': self.overlapped_time
+        }
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            t0 = time.perf_counter()
+            method, args = item
+            try:
+                getattr(self.storage, method)(*args)
+            except BaseException as e:
+                self.error = e
+            self.io_time += time.perf_counter() - t0
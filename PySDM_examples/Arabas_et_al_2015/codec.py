@@ -0,0 +1,104 @@
+"""
+Created at 18.10.2026
+"""
+
+import numpy as np
+
+
+class ErrorBoundedCodec:
+    """ opt-in lossy codec for `Storage` fields bounding the relative error by `rtol`:
+        - non-negative data (e.g. concentration spectra) are quantised in log space, bounding the
+          pointwise relative error (zeros are kept exact),
+        - other data are quantised linearly, bounding the error relative to the field maximum;
+        integer codes are delta-encoded against the previous saved step of the same variable,
+        with a keyframe every `keyframe_interval` saves to keep random access cheap """
+
+    def __init__(self, rtol: float = 1e-3, keyframe_interval: int = 10):
+        self.rtol = rtol
+        self.keyframe_interval = keyframe_interval
+        self.log_step = 2 * np.log1p(rtol)
+        self.previous = {}
+        self.stats = {}
+
+    def reset(self):
+        self.previous = {}
+        self.stats = {}
+
+    def encode(self, data: np.ndarray, name: str, step: int) -> dict:
+        finite = np.isfinite(data)
+        mode = 'log' if np.all(data[finite] >= 0) else 'linear'
+        codes, scale = self._quantise(np.where(finite, data, 0), mode)
+
+        previous_step, previous_codes, n_since_keyframe = self.previous.get(name, (-1, None, 0))
+        keyframe = (
+            previous_codes is None
+            or previous_codes.shape != codes.shape
+            or n_since_keyframe + 1 >= self.keyframe_interval
+        )
+        record = {
+            'mode': np.array(mode),
+            'scale': np.array(scale),
+            'reference': np.array(-1 if keyframe else previous_step),
+            'codes': codes if keyframe else codes - previous_codes,
+            'zeros': np.packbits(data == 0),
+            'nonfinite_index': np.flatnonzero(~finite),
+            'nonfinite_values': data[~finite]
+        }
+        self.previous[name] = (step, codes, 0 if keyframe else n_since_keyframe + 1)
+        self._account(name, data, self._dequantise(codes, mode, scale, record['zeros'], finite))
+        return record
+
+    def decode(self, record, reference_codes: (np.ndarray, None)) -> (np.ndarray, np.ndarray):
+        codes = record['codes'] if reference_codes is None else reference_codes + record['codes']
+        finite = np.ones(codes.shape, dtype=bool)
+        finite.flat[record['nonfinite_index']] = False
+        data = self._dequantise(codes, str(record['mode']), float(record['scale']), record['zeros'], finite)
+        data.flat[record['nonfinite_index']] = record['nonfinite_values']
+        return data, codes
+
+    def report(self) -> dict:
+        """ achieved maximal errors (relative to the local value for log-quantised variables
+            and to the field maximum for linearly quantised ones) vs. the uncompressed input """
+        return {
+            name: {
+                'max_relative_error': stat['max_relative_error'],
+                'compression_ratio': stat['raw_bytes'] / stat['stored_bytes'] if stat['stored_bytes'] else np.nan
+            }
+            for name, stat in self.stats.items()
+        }
+
+    def account_stored_bytes(self, name: str, n_bytes: int):
+        self.stats[name]['stored_bytes'] += n_bytes
+
+    def _quantise(self, data, mode):
+        if mode == 'log':
+            positive = data > 0
+            codes = np.zeros(data.shape, dtype=np.int32)
+            codes[positive] = np.round(np.log(data[positive]) / self.log_step)
+            return codes, self.log_step
+        scale = 2 * self.rtol * np.amax(np.abs(data), initial=0)
+        if scale == 0:
+            scale = 1
+        return np.round(data / scale).astype(np.int32), scale
+
+    @staticmethod
+    def _dequantise(codes, mode, scale, zeros, finite):
+        if mode == 'log':
+            data = np.exp(codes * scale)
+        else:
+            data = codes * scale
+        zeros = np.unpackbits(zeros, count=codes.size).reshape(codes.shape).astype(bool)
+        data[zeros | ~finite] = 0
+        return data
+
+    def _account(self, name, data, decoded):
+        finite = np.isfinite(data)
+        error = np.abs(decoded[finite] - data[finite])
+        if np.any(data[finite] < 0):
+            error /= np.amax(np.abs(data[finite]))
+        else:
+            nonzero = data[finite] != 0
+            error = error[nonzero] / data[finite][nonzero]
+        stat = self.stats.setdefault(name, {'max_relative_error': 0., 'raw_bytes': 0, 'stored_bytes': 0})
+        stat['max_relative_error'] = max(stat['max_relative_error'], np.amax(error, initial=0))
+        stat['raw_bytes'] += data.astype(np.float32).nbytes
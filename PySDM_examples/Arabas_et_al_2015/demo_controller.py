@@ -3,12 +3,13 @@ Created at 02.10.2019
 """
 
 from ..utils.widgets import FloatProgress, Button, HBox
+from ..utils.throughput import ThroughputMeter
 from time import sleep
 from threading import Thread
 
 
 class DemoController:
-    def __init__(self, simulator, viewer, exporter, ncdf_file):
+    def __init__(self, simulator, viewer, exporter, ncdf_file, metrics=None):
         self.progress = FloatProgress(value=0.0, min=0.0, max=1.0)
         self.button = Button()
         self.link = HBox()
@@ -18,10 +19,12 @@ class DemoController:
         self.exporter = exporter
         self.ncdf_file = ncdf_file
         self.viewer = viewer
+        self.meter = ThroughputMeter(metrics)
         self._setup_play()
 
     def __enter__(self):
         self.panic = False
+        self.meter.start()
         self.set_percent(0)
 
     def __exit__(self, *_):
@@ -46,6 +49,7 @@ class DemoController:
     def set_percent(self, value):
         self.progress.description = 'running'
         self.progress.value = value
+        self.meter.update(value)
 
     def _setup_play(self):
         self.button.on_click(self._handle_stop, remove=True)
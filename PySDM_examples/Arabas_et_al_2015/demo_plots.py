@@ -113,9 +113,9 @@ class _TimeseriesPlot(_Plot):
         if show:
             plt.show()
 
-    def update(self, data):
+    def update(self, data, start=0):
         if data is not None:
-            self.ydata[0:len(data)] = data[:]
+            self.ydata[start:start + len(data)] = data[:]
         else:
-            self.ydata[0:len(data)] = np.nan
+            self.ydata[start:] = np.nan
         self.timeseries.set_ydata(self.ydata)
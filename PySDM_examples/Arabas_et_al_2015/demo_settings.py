@@ -53,11 +53,15 @@ class DemoSettings:
         self.tot_description = "MPDATA: third-order terms option"
         self.iga_description = "MPDATA: infinite gauge option"
         self.nit_description = "MPDATA: number of iterations (1=UPWIND)"
+        self.concurrent_description = "MPDATA: advance advectees concurrently"
+        self.asynchronous_description = "MPDATA: overlap with particle-based processes"
         self.ui_mpdata_options = [
             Checkbox(value=settings.mpdata_fct, description=self.fct_description),
             Checkbox(value=settings.mpdata_tot, description=self.tot_description),
             Checkbox(value=settings.mpdata_iga, description=self.iga_description),
-            IntSlider(value=settings.mpdata_iters, description=self.nit_description, min=1, max=5)
+            IntSlider(value=settings.mpdata_iters, description=self.nit_description, min=1, max=5),
+            Checkbox(value=settings.mpdata_concurrent, description=self.concurrent_description),
+            Checkbox(value=settings.mpdata_asynchronous, description=self.asynchronous_description)
         ]
 
         # TODO #37
@@ -79,6 +83,10 @@ class DemoSettings:
         self.coalescence_optimized_random = settings.coalescence_optimized_random
         self.coalescence_substeps = settings.coalescence_substeps
         self.output_interval = settings.output_interval
+        self.output_policies = settings.output_policies
+        self.checkpoint_interval = settings.checkpoint_interval
+        self.threads_advection_share = settings.threads_advection_share
+        self.threads_adaptive = settings.threads_adaptive
         self.versions = settings.versions
 
     @property
@@ -180,6 +188,20 @@ class DemoSettings:
                 return widget.value
         raise Exception()
 
+    @property
+    def mpdata_concurrent(self):
+        for widget in self.ui_mpdata_options:
+            if widget.description == self.concurrent_description:
+                return widget.value
+        raise Exception()
+
+    @property
+    def mpdata_asynchronous(self):
+        for widget in self.ui_mpdata_options:
+            if widget.description == self.asynchronous_description:
+                return widget.value
+        raise Exception()
+
     def box(self):
         layout = Accordion(children=[
             VBox([self.ui_th_std0, self.ui_qv0, self.ui_p0, self.ui_kappa, self.ui_amplitude]),
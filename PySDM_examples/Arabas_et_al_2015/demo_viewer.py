@@ -9,6 +9,7 @@ from ..utils.show_plot import save_and_make_link
 from ..utils.widgets import VBox, Box, Play, Output, IntSlider, IntRangeSlider, jslink, \
     HBox, Dropdown, Button, Layout, clear_output, display
 from .demo_plots import _ImagePlot, _SpectrumPlot, _TimeseriesPlot
+from .output_policy import output_policy
 from matplotlib import pyplot, rcParams
 
 
@@ -56,6 +57,7 @@ class DemoViewer:
             fig_kw = {'figsize': (2.25 * default_figsize[0], default_figsize[1] / 2)}
             fig, ax = pyplot.subplots(1, 1, **fig_kw)
             self.timeseriesPlot = _TimeseriesPlot(fig, ax, self.settings.output_steps * self.settings.dt)
+            self.timeseries_length = 0
             clear_output()
 
         self.plots = {}
@@ -143,8 +145,11 @@ class DemoViewer:
         yrange = slice(*self.slider['Z'].value)
 
         for key in ('Particles Wet Size Spectrum', 'Particles Dry Size Spectrum'):
+            if not self.storage.available(key, self.settings.output_steps[step]):
+                continue
             try:
                 data = self.storage.load(key, self.settings.output_steps[step])
+                data = output_policy(self.settings, key).uncrop(data, self.settings.grid)
                 data = data[xrange, yrange, :]
                 data = np.mean(np.mean(data, axis=0), axis=0)
                 data = np.concatenate(((0,), data))
@@ -177,9 +182,10 @@ class DemoViewer:
             self.plot_box.children = [self.outputs[selected]]
 
         step = self.step_slider.value
-        try:
+        if self.storage.available(selected, self.settings.output_steps[step]):
             data = self.storage.load(selected, self.settings.output_steps[step])
-        except self.storage.Exception:
+            data = output_policy(self.settings, selected).uncrop(data, self.settings.grid)
+        else:
             data = None
 
         self.plots[selected].update(data, step)
@@ -196,10 +202,12 @@ class DemoViewer:
 
     def update_timeseries(self):
         try:
-            data = self.storage.load('surf_precip')
+            data = self.storage.load_tail('surf_precip', self.timeseries_length)
+            self.timeseriesPlot.update(data, start=self.timeseries_length)
+            self.timeseries_length += len(data)
         except self.storage.Exception:
-            data = None
-        self.timeseriesPlot.update(data)
+            self.timeseriesPlot.update(None)
+            self.timeseries_length = 0
 
     def replot_timeseries(self):
         self.update_timeseries()
@@ -1,11 +1,14 @@
 from PySDM.products.stats.timers import CPUTime, WallTime
+from ..utils.throughput import ThroughputMeter
 
 
 class DummyController:
 
-    def __init__(self):
+    def __init__(self, metrics=None, label: str = None, verbose: bool = True):
         self.panic = False
+        self.verbose = verbose
         self.t_last = self.__times()
+        self.meter = ThroughputMeter(metrics, label)
 
     @staticmethod
     def __times():
@@ -15,9 +18,12 @@ class DummyController:
         t_curr = self.__times()
         wall_time = (t_curr[0] - self.t_last[0])
         cpu_time = (t_curr[1] - self.t_last[1])
-        print(f"{100 * value:.1f}% (times since last print: cpu={cpu_time:.1f}s wall={wall_time:.1f}s)")
+        if self.verbose:
+            print(f"{100 * value:.1f}% (times since last print: cpu={cpu_time:.1f}s wall={wall_time:.1f}s)")
         self.t_last = self.__times()
+        self.meter.update(value)
 
-    def __enter__(*_): pass
+    def __enter__(self):
+        self.meter.start()
 
     def __exit__(*_): pass
@@ -0,0 +1,121 @@
+"""
+Created at 18.10.2026
+"""
+
+import os
+import time
+import queue
+import traceback
+import multiprocessing
+from concurrent.futures import wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from .dummy_controller import DummyController
+from ..utils.throughput import ThroughputMeter
+from ..utils.process_pool import spawned_pool
+
+
+class _ProgressController:
+    """ worker-side controller forwarding `Simulation.run()` progress to the parent process """
+
+    def __init__(self, progress_queue, index, metrics=None):
+        self.progress_queue = progress_queue
+        self.index = index
+        self.panic = False
+        self.meter = ThroughputMeter(metrics, label=f"member {index}")
+
+    def __enter__(self):
+        self.meter.start()
+
+    def __exit__(self, *_):
+        pass
+
+    def set_percent(self, value):
+        self.progress_queue.put((self.index, value))
+        self.meter.update(value)
+
+
+def _run_member(index, member, progress_queue):
+    from .simulation import Simulation
+    from .storage import Storage
+    from .netcdf_exporter import NetCDFExporter
+
+    file = member.get('file')
+    filename = getattr(file, 'absolute_path', file)
+    result = {'index': index, 'file': filename, 'storage': member.get('storage'), 'wall_time': None, 'error': None}
+    t0 = time.perf_counter()
+    try:
+        settings = member['settings']
+        storage = Storage(path=member.get('storage'), memmap=True)
+        simulation = Simulation(settings, storage)
+        if filename is not None:
+            simulation.sinks.append(NetCDFExporter(storage, settings, simulation, filename))
+        simulation.reinit(member.get('products'))
+        simulation.run(_ProgressController(progress_queue, index, member.get('metrics')))
+    except Exception:
+        result['error'] = traceback.format_exc()
+    result['wall_time'] = time.perf_counter() - t0
+    return result
+
+
+def run_ensemble(members, max_workers: int = None, numba_threads: int = 1, controller=None,
+                 retries: int = 1) -> list:
+    """ runs independent `Simulation`s in a pool of (spawned) processes, each limited to `numba_threads`
+        numba threads (by default, as many workers as fit the cores); `members` are dicts with
+        `settings`, optional `products` (passed to `reinit()`), `file` (NetCDF output path or
+        `TemporaryFile`, streamed by a `NetCDFExporter`), `storage` (directory, temporary by default)
+        and `metrics` (path of a JSON-lines file the member's `ThroughputMeter` records are appended to);
+        the progress of all members is reported as one to `controller`; returns one dict per member
+        with `wall_time` and `error` (traceback) - failing members do not abort the others and members
+        running when a worker process dies are resubmitted up to `retries` times """
+    if controller is None:
+        controller = DummyController()
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // numba_threads)
+    context = multiprocessing.get_context('spawn')
+    results = [None] * len(members)
+    progress = [0.] * len(members)
+    attempts = [0] * len(members)
+    todo = list(range(len(members)))
+    reported = None
+
+    with controller, context.Manager() as manager:
+        progress_queue = manager.Queue()
+        while todo and not controller.panic:
+            broken = []
+            with spawned_pool(min(max_workers, len(todo)), numba_threads) as executor:
+                futures = {executor.submit(_run_member, i, members[i], progress_queue): i for i in todo}
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=.5, return_when=FIRST_COMPLETED)
+                    while True:
+                        try:
+                            index, value = progress_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        progress[index] = max(progress[index], value)
+                    for future in done:
+                        index = futures[future]
+                        progress[index] = 1
+                        try:
+                            results[index] = future.result()
+                        except BrokenProcessPool:
+                            attempts[index] += 1
+                            if attempts[index] <= retries:
+                                progress[index] = 0
+                                broken.append(index)
+                            else:
+                                results[index] = {'index': index, 'error': "worker process terminated abruptly"}
+                        except BaseException:
+                            results[index] = {'index': index, 'error': traceback.format_exc()}
+                    if done or sum(progress) != reported:
+                        reported = sum(progress)
+                        controller.set_percent(reported / len(progress))
+                    if controller.panic:
+                        for future in pending:
+                            future.cancel()
+            todo = broken
+
+    for index, result in enumerate(results):
+        if result is None:
+            results[index] = {'index': index, 'error': "cancelled"}
+    return results
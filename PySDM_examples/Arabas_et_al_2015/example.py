@@ -6,6 +6,7 @@ from PySDM_examples.Arabas_et_al_2015.netcdf_exporter import NetCDFExporter
 from PySDM_examples.Arabas_et_al_2015.settings import Settings, si
 from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
 from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM_examples.Arabas_et_al_2015.async_storage import AsyncStorage
 from PySDM_examples.utils.temporary_file import TemporaryFile
 
 
@@ -16,13 +17,15 @@ def main():
     settings.grid = (25, 25)
     settings.simulation_time = 5400 * si.second
 
-    storage = Storage()
+    storage = AsyncStorage(Storage(memmap=True))
     simulation = Simulation(settings, storage)
+    temp_file = TemporaryFile('.nc')
+    simulation.sinks.append(NetCDFExporter(storage, settings, simulation, temp_file.absolute_path))
     simulation.reinit()
     simulation.run()
-    temp_file = TemporaryFile('.nc')
-    exporter = NetCDFExporter(storage, settings, simulation, temp_file.absolute_path)
-    exporter.run()
+    print(f"storage I/O time overlapped with computation: {storage.overlapped_time:.1f}s"
+          f" (of {storage.io_time:.1f}s)")
+    print(simulation.timing_summary)
 
 
 if __name__ == '__main__':
@@ -2,66 +2,19 @@
 Created at 16.12.2019
 """
 
-from PySDM_examples.Arabas_et_al_2015.settings import Settings
-from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
-from PySDM_examples.Arabas_et_al_2015.storage import Storage
-from PySDM.products.stats.timers import WallTime
-import PySDM.backends.numba.conf
-from PySDM.backends import CPU, GPU
-import importlib
+import sys
+from PySDM.backends import GPU
+from PySDM_examples.benchmarks.__main__ import main as benchmarks
 
 
-def reload_CPU_backend():
-    importlib.reload(PySDM.backends.numba.impl._algorithmic_methods)
-    importlib.reload(PySDM.backends.numba.impl._index_methods)
-    importlib.reload(PySDM.backends.numba.impl._pair_methods)
-    importlib.reload(PySDM.backends.numba.impl._physics_methods)
-    importlib.reload(PySDM.backends.numba.impl.storage_impl)
-    importlib.reload(PySDM.backends)
-    from PySDM.backends import CPU
-
-
-def main():
-    settings = Settings()
-
-    settings.grid = (25, 25)
-    settings.simulation_time = settings.dt * 100
-    settings.output_interval = settings.dt * 10
-    settings.processes = {
-        "particle advection": True,
-        "fluid advection": True,
-        "coalescence": True,
-        "condensation": False,
-        "sedimentation": True,
-    }
-
-    n_sd = range(14, 16, 1)
-
-    times = {}
-    backends = [(CPU, "sync"), (CPU, "async")]
-    if GPU.ENABLE:
-        backends.append((GPU, "async"))
-    for backend, mode in backends:
-        if backend is CPU:
-            PySDM.backends.numba.conf.NUMBA_PARALLEL = mode
-            reload_CPU_backend()
-        key = f"{backend} (mode={mode})"
-        times[key] = []
-        for sd in n_sd:
-            settings.n_sd_per_gridbox = sd
-            storage = Storage()
-            simulation = Simulation(settings, storage, backend)
-            simulation.reinit(products=[WallTime()])
-            simulation.run()
-            times[key].append(storage.load('wall_time')[-1])
-
-    from matplotlib import pyplot as plt
-    for parallelization, t in times.items():
-        plt.plot(n_sd, t, label=parallelization)
-    plt.legend()
-    plt.loglog()
-    plt.savefig("benchmark.pdf", format="pdf")
+def main(argv=()) -> int:
+    """ sync vs. async numba parallelism (and the GPU backend, if available) for the 2D kinematic case,
+        each configuration timed in a separate process by the benchmark suite; further arguments
+        are passed on (see `python -m PySDM_examples.benchmarks matrix --help`) """
+    backends = ('CPU', 'GPU') if GPU.ENABLE else ('CPU',)
+    return benchmarks(['matrix', '--cases', 'kinematic_2d', '--parallel', 'sync', 'async',
+                       '--backends', *backends, *argv])
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Created at 18.10.2026
+"""
+
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM.products.stats.timers import WallTime
+from PySDM import products as PySDM_products
+from PySDM.backends import CPU
+import numba
+
+
+def main():
+    settings = Settings()
+
+    settings.grid = (64, 64)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = settings.dt * 100
+    settings.output_interval = settings.dt * 10
+    settings.processes = {
+        "particle advection": True,
+        "fluid advection": True,
+        "coalescence": False,
+        "condensation": False,
+        "sedimentation": False,
+    }
+
+    print(f"numba threads: {numba.get_num_threads()}")
+    for concurrent in (False, True):
+        settings.mpdata_concurrent = concurrent
+        storage = Storage()
+        simulation = Simulation(settings, storage, CPU)
+        for _ in range(2):  # the first run includes JIT compilation
+            simulation.reinit(products=[WallTime(), PySDM_products.DynamicWallTime('EulerianAdvection')])
+            simulation.run()
+
+        solvers = simulation.core.dynamics['EulerianAdvection'].solvers
+        wall_time = storage.load('wall_time')[1:].sum()
+        advection_time = storage.load('EulerianAdvection_wall_time')[1:].sum()
+        print(f"concurrent={concurrent}: {len(solvers.mpdatas)} advectees x {solvers.n_threads} numba thread(s),"
+              f" wall time {wall_time:.3f}s,"
+              f" advection {advection_time:.3f}s ({100 * advection_time / wall_time:.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,10 +11,11 @@ from PySDM_examples.utils.widgets import display, Tab, VBox, HTML
 
 def launch():
     settings = DemoSettings()
-    storage = Storage()
+    storage = Storage(memmap=True)
     simulator = Simulation(settings, storage)
     temporary_file = TemporaryFile('.nc')
     exporter = NetCDFExporter(storage, settings, simulator, temporary_file.absolute_path)
+    simulator.sinks.append(exporter)
 
     viewer = DemoViewer(storage, settings)
 
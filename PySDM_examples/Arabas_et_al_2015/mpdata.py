@@ -2,33 +2,44 @@
 Created at 04.09.2020
 """
 
+import time
 import numpy as np
+import numba
 from threading import Thread
-from PyMPDATA import Options, Stepper, VectorField, ScalarField, Solver
+from concurrent.futures import ThreadPoolExecutor
+from PyMPDATA import VectorField, ScalarField, Solver
 from PyMPDATA.arakawa_c.boundary_condition.periodic_boundary_condition import PeriodicBoundaryCondition
 from PySDM.backends.numba import conf
 from numba.core.errors import NumbaExperimentalFeatureWarning
+from ..utils.jit_cache import cached_stepper
 
 
 class MPDATA:
     def __init__(self, *, fields,
                  n_iters=2, infinite_gauge=True,
-                 flux_corrected_transport=True, third_order_terms=False):
+                 flux_corrected_transport=True, third_order_terms=False, concurrent=False):
+        """ with `concurrent=True` all advectees (which share the advector and g_factor) are advanced
+            at the same time on pool threads (the numba kernels release the GIL), each by a stepper
+            using its share of the numba threads, instead of one after another by a stepper using all """
         self.grid = fields.g_factor.shape
         self.asynchronous = False
         self.thread: (Thread, None) = None
+        self.executor: (ThreadPoolExecutor, None) = None
+        self.advection_time = 0
+        self.wait_time = 0
+        self.thread_budget = None
+        self.concurrent = concurrent
+        self.n_threads = self._split(numba.get_num_threads(), len(fields.advectees))
 
-        options = Options(
+        self.stepper_options = dict(
             n_iters=n_iters,
             infinite_gauge=infinite_gauge,
             flux_corrected_transport=flux_corrected_transport,
             third_order_terms=third_order_terms
         )
-        disable_threads_if_needed = {}
-        if not conf.JIT_FLAGS['parallel']:
-            disable_threads_if_needed['n_threads'] = 1
-
-        stepper = Stepper(options=options, grid=self.grid, non_unit_g_factor=True, **disable_threads_if_needed)
+        options, stepper = cached_stepper(
+            self.stepper_options, grid=self.grid, non_unit_g_factor=True, n_threads=self.n_threads
+        )
 
         # CFL condition
         for d in range(len(fields.advector)):
@@ -46,25 +57,77 @@ class MPDATA:
             advectee = ScalarField(np.full(self.grid, v, dtype=options.dtype), halo=options.n_halo,
                                    boundary_conditions=(PeriodicBoundaryCondition(), PeriodicBoundaryCondition()))
             self.mpdatas[k] = Solver(stepper=stepper, advectee=advectee, advector=advector_impl, g_factor=g_factor_impl)
+        self._advector_impl = advector_impl
+        self._g_factor_impl = g_factor_impl
+
+        if concurrent and len(self.mpdatas) > 1:
+            self.executor = ThreadPoolExecutor(max_workers=len(self.mpdatas), thread_name_prefix='MPDATA')
+
+    def __del__(self):
+        if getattr(self, 'executor', None) is not None:
+            self.executor.shutdown(wait=False)
+
+    def _split(self, n_threads: int, n_advectees: int) -> int:
+        """ threads used by each stepper: all given (one at a time) or an equal share of them (concurrent) """
+        if not conf.JIT_FLAGS['parallel']:
+            return 1
+        if self.concurrent:
+            return max(1, n_threads // n_advectees)
+        return n_threads
 
     def __getitem__(self, item):
         return self.mpdatas[item]
 
     def __call__(self):
         if self.asynchronous:
+            self.wait()
             self.thread = Thread(target=self.step, args=())
             self.thread.start()
         else:
             self.step()
 
     def wait(self):
+        """ blocks until a step started in asynchronous mode completes (the time spent here
+            is the part of `advection_time` which was not overlapped with other work) """
         if self.asynchronous:
             if self.thread is not None:
+                t0 = time.perf_counter()
                 self.thread.join()
+                self.wait_time += time.perf_counter() - t0
+                self.thread = None
+
+    def set_n_threads(self, n_threads: int):
+        """ switches (after the pending asynchronous step, if any) to steppers using `n_threads`
+            threads (in total, if `concurrent`), keeping the advectee fields (steppers are compiled
+            once per thread count) """
+        self.wait()
+        self.n_threads = self._split(n_threads, len(self.mpdatas))
+        _, stepper = cached_stepper(self.stepper_options, grid=self.grid, non_unit_g_factor=True,
+                                    n_threads=self.n_threads)
+        self.mpdatas = {
+            k: Solver(stepper=stepper, advectee=solver.advectee, advector=self._advector_impl,
+                      g_factor=self._g_factor_impl)
+            for k, solver in self.mpdatas.items()
+        }
 
     def step(self):
-        try:  # TODO #417: move this to within PyMPDATA
+        if self.thread_budget is not None:
+            self.thread_budget.enter_advection()
+        t0 = time.perf_counter()
+        self._step()
+        self.advection_time += time.perf_counter() - t0
+
+    def _step(self):
+        if self.executor is None:
             for mpdata in self.mpdatas.values():
-                mpdata.advance(1)
+                self._advance(mpdata)
+        else:
+            for future in [self.executor.submit(self._advance, mpdata) for mpdata in self.mpdatas.values()]:
+                future.result()
+
+    @staticmethod
+    def _advance(mpdata):
+        try:  # TODO #417: move this to within PyMPDATA
+            mpdata.advance(1)
         except NumbaExperimentalFeatureWarning:
             pass
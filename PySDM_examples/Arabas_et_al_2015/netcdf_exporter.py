@@ -1,76 +1,201 @@
 import numpy as np
 from scipy.io.netcdf import netcdf_file
 from .dummy_controller import DummyController
+from .output_policy import output_policy, DEFAULT_POLICY
+
+
+def _attribute_value(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return int(value)
+    if isinstance(value, (int, float, np.number)):
+        return value
+    if isinstance(value, (np.ndarray, list, tuple)):
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            return None
+        if array.dtype.kind == 'b':
+            array = array.astype(np.int8)
+        if array.dtype.kind in 'iuf' and array.ndim == 1 and array.size > 0:
+            return array
+    return None
 
 
 class NetCDFExporter:
-    def __init__(self, storage, settings, simulator, filename):
+    """ writes classic NetCDF through `scipy.io.netcdf` or, with `netcdf4=True`, NetCDF4/HDF5 through
+        the (optional) `netCDF4` package with per-output-step chunks and lossless zlib compression;
+        precision reduction is opt-in via `least_significant_digit` """
+    def __init__(self, storage, settings, simulator, filename,
+                 netcdf4=False, complevel=4, least_significant_digit=None):
         self.storage = storage
         self.settings = settings
         self.simulator = simulator
         self.vars = {}
         self.filename = filename
         self.XZ = ('X', 'Z')
+        self.ncdf = None
+        self.step_index = {}
+        self.complete = False
+        self.netcdf4 = netcdf4
+        self.complevel = complevel
+        self.least_significant_digit = least_significant_digit
+
+    def _open(self):
+        if self.netcdf4:
+            try:
+                from netCDF4 import Dataset
+            except ImportError:
+                raise ImportError("netcdf4=True requires the netCDF4 package (pip install netCDF4)")
+            return Dataset(self.filename, mode='w', format='NETCDF4')
+        return netcdf_file(self.filename, mode='w')
+
+    def _create_variable(self, ncdf, name, dimensions):
+        if not self.netcdf4:
+            return ncdf.createVariable(name, "f", dimensions)
+        chunksizes = [ncdf.dimensions[dimension].size for dimension in dimensions]
+        if len(dimensions) > 1 and dimensions[0].startswith("T"):
+            chunksizes[0] = 1
+        return ncdf.createVariable(
+            name, "f", dimensions,
+            zlib=True,
+            shuffle=True,
+            complevel=self.complevel,
+            chunksizes=chunksizes,
+            least_significant_digit=self.least_significant_digit if name in self.simulator.products else None
+        )
 
     def _write_settings(self, ncdf):
+        """ public, non-callable settings which are numbers, strings or numeric arrays
+            (booleans stored as integers) - the ones both NetCDF backends can store as attributes """
         for setting in dir(self.settings):
-            setattr(ncdf, setting, getattr(self.settings, setting))
+            if setting.startswith('_'):
+                continue
+            value = getattr(self.settings, setting)
+            if callable(value):
+                continue
+            value = _attribute_value(value)
+            if value is not None:
+                setattr(ncdf, setting, value)
+
+    def _time_dimension(self, policy):
+        return "T" if policy.stride == 1 else f"T_{policy.stride}"
+
+    def _space_dimensions(self, policy):
+        if policy.window is None:
+            return self.XZ
+        return tuple(
+            f"{label}_{rng.start}_{rng.stop}" + ("" if rng.step == 1 else f"_{rng.step}")
+            for label, rng in zip(self.XZ, policy.ranges(self.settings.grid))
+        )
+
+    def _coordinates(self):
+        """ coordinate values and units for the common and all per-product (see `OutputPolicy`) dimensions """
+        result = {}
+        for policy in (DEFAULT_POLICY, *(output_policy(self.settings, name) for name in self.simulator.products)):
+            steps = policy.steps(self.settings.output_steps)
+            result[self._time_dimension(policy)] = (steps * self.settings.dt, "seconds")
+            for index, (label, rng) in enumerate(zip(self._space_dimensions(policy), policy.ranges(self.settings.grid))):
+                dx = self.settings.size[index] / self.settings.grid[index]
+                result[label] = (dx * (1 / 2 + np.asarray(rng)), "metres")
+        return result
 
     def _create_dimensions(self, ncdf):
-        ncdf.createDimension("T", len(self.settings.output_steps))
-        for index, label in enumerate(self.XZ):
-            ncdf.createDimension(label, self.settings.grid[index])
+        for label, (values, _) in self._coordinates().items():
+            ncdf.createDimension(label, len(values))
         ncdf.createDimension("ParticleVolume", len(self.settings.v_bins) - 1)
 
     def _create_variables(self, ncdf):
-        self.vars["T"] = ncdf.createVariable("T", "f", ["T"])
-        self.vars["T"].units = "seconds"
-
-        for index, label in enumerate(self.XZ):
-            self.vars[label] = ncdf.createVariable(label, "f", (label,))
-            self.vars[label][:] = (self.settings.size[index] / self.settings.grid[index]) * (1 / 2 + np.arange(self.settings.grid[index]))
-            self.vars[label].units = "metres"
+        self.vars = {}
+        for label, (values, units) in self._coordinates().items():
+            self.vars[label] = self._create_variable(ncdf, label, (label,))
+            self.vars[label][:] = values
+            self.vars[label].units = units
 
         # TODO #340 ParticleVolume var
 
         for name, instance in self.simulator.products.items():
             assert name not in self.vars
 
+            policy = output_policy(self.settings, name)
             n_dimensions = len(instance.shape)
             if n_dimensions == 3:
-                dimensions = ("T", "X", "Z", "ParticleVolume")
+                dimensions = (self._time_dimension(policy), *self._space_dimensions(policy), "ParticleVolume")
             elif n_dimensions == 2:
-                dimensions = ("T", "X", "Z")
+                dimensions = (self._time_dimension(policy), *self._space_dimensions(policy))
             elif n_dimensions == 0:
-                dimensions = ("T",)
+                dimensions = (self._time_dimension(policy),)
             else:
                 raise NotImplementedError()
-            self.vars[name] = ncdf.createVariable(name, "f", dimensions)
+            self.vars[name] = self._create_variable(ncdf, name, dimensions)
             self.vars[name].units = instance.unit
             self.vars[name].long_name = instance.description
 
     def _write_variables(self, i):
-        self.vars["T"][i] = self.settings.output_steps[i] * self.settings.dt
         for var in self.simulator.products.keys():
+            policy = output_policy(self.settings, var)
+            if not policy.stores(i):
+                continue
             n_dimensions = len(self.simulator.products[var].shape)
-            if n_dimensions == 3:
-                self.vars[var][i, :, :, :] = self.storage.load(var, self.settings.output_steps[i])
-            elif n_dimensions == 2:
-                self.vars[var][i, :, :] = self.storage.load(var, self.settings.output_steps[i])
+            if n_dimensions in (2, 3):
+                self.vars[var][i // policy.stride, ...] = self.storage.load(var, self.settings.output_steps[i])
             elif n_dimensions == 0:
                 if i == 0:
-                    self.vars[var][:] = self.storage.load(var)
+                    data = self.storage.load(var)
+                    self.vars[var][0:len(data)] = data
                 else:
                     pass
             else:
                 raise NotImplementedError()
 
+    def init(self, settings):
+        """ storage-sink interface: creates the file at `Simulation.reinit()` so that
+            each output step is written directly by `Simulation.store()` """
+        self.flush()
+        self.settings = settings
+        self.complete = False
+        self.step_index = {step: index for index, step in enumerate(settings.output_steps)}
+        self.ncdf = self._open()
+        self._write_settings(self.ncdf)
+        self._create_dimensions(self.ncdf)
+        self._create_variables(self.ncdf)
+
+    def resume(self, settings, step: int):
+        """ storage-sink interface: recreates the file at `Simulation.resume()`, filling in the output
+            steps up to `step` from the storage (which is resumed first) """
+        self.init(settings)
+        for i, output_step in enumerate(settings.output_steps):
+            if output_step > step:
+                break
+            self._write_variables(i)
+
+    def save(self, data: (float, np.ndarray), step: int, name: str):
+        index = self.step_index[step] // output_policy(self.settings, name).stride
+        if isinstance(data, (int, float)):
+            self.vars[name][index] = data
+        else:
+            self.vars[name][index, ...] = data
+        if step == self.settings.output_steps[-1]:
+            self.complete = True
+
+    def commit(self, step: int):
+        pass
+
+    def flush(self):
+        if self.ncdf is not None:
+            self.ncdf.close()
+            self.ncdf = None
+
     def run(self, controller=None):
         if controller is None:
             controller = DummyController()
         with controller:
             controller.set_percent(0)
-            with netcdf_file(self.filename, mode='w') as ncdf:
+            if self.complete:
+                controller.set_percent(1)
+                return
+            with self._open() as ncdf:
                 self._write_settings(ncdf)
                 self._create_dimensions(ncdf)
                 self._create_variables(ncdf)
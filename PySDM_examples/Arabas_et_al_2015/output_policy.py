@@ -0,0 +1,49 @@
+"""
+Created at 18.10.2026
+"""
+
+import numpy as np
+
+
+class OutputPolicy:
+    """ per-product output cadence (every `stride`-th entry of `settings.output_steps`)
+        and optional spatial window (a pair of slices over the X and Z grid dimensions) """
+
+    def __init__(self, stride: int = 1, window: (tuple, None) = None):
+        assert stride >= 1
+        self.stride = stride
+        self.window = window
+
+    def stores(self, output_index: int) -> bool:
+        return output_index % self.stride == 0
+
+    def steps(self, output_steps: np.ndarray) -> np.ndarray:
+        return output_steps[::self.stride]
+
+    def ranges(self, grid: tuple) -> tuple:
+        if self.window is None:
+            return tuple(range(n) for n in grid)
+        return tuple(range(*window.indices(n)) for window, n in zip(self.window, grid))
+
+    def shape(self, grid: tuple) -> tuple:
+        return tuple(len(rng) for rng in self.ranges(grid))
+
+    def crop(self, data: (float, np.ndarray)) -> (float, np.ndarray):
+        if self.window is None or isinstance(data, (int, float)):
+            return data
+        return data[self.window[0], self.window[1]]
+
+    def uncrop(self, data: np.ndarray, grid: tuple) -> np.ndarray:
+        """ embeds windowed data in a NaN-filled array spanning the whole grid """
+        if self.window is None:
+            return data
+        result = np.full((*grid, *data.shape[2:]), np.nan, dtype=data.dtype)
+        result[self.window[0], self.window[1]] = data
+        return result
+
+
+DEFAULT_POLICY = OutputPolicy()
+
+
+def output_policy(settings, name: str) -> OutputPolicy:
+    return getattr(settings, 'output_policies', {}).get(name, DEFAULT_POLICY)
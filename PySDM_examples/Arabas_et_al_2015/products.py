@@ -0,0 +1,102 @@
+"""
+Created at 18.10.2026
+"""
+
+import numpy as np
+from PySDM.products.product import Product
+from PySDM.products.stats.timers import CPUTime, WallTime
+from PySDM import products as PySDM_products
+
+
+class _AdvectionTimer(Product):
+    """ time accumulated by the `MPDATA` solvers of the `EulerianAdvection` dynamic
+        since the previous call to `get()` """
+
+    def __init__(self, name, description, unit="s"):
+        super().__init__(name=name, unit=unit, description=description)
+        self.solvers = None
+        self.last = 0
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+        self.solvers = self.core.dynamics['EulerianAdvection'].solvers
+        self.last = self.total()
+
+    def total(self):
+        raise NotImplementedError()
+
+    def get(self):
+        total = self.total()
+        result = total - self.last
+        self.last = total
+        return result
+
+
+class AdvectionTime(_AdvectionTimer):
+    def __init__(self):
+        super().__init__(name='advection_time', description="MPDATA compute time")
+
+    def total(self):
+        return self.solvers.advection_time
+
+
+class AdvectionWaitTime(_AdvectionTimer):
+    def __init__(self):
+        super().__init__(name='advection_wait_time',
+                         description="time spent waiting for asynchronous MPDATA steps to complete")
+
+    def total(self):
+        return self.solvers.wait_time
+
+
+class AdvectionOverlap(_AdvectionTimer):
+    """ fraction of MPDATA compute time overlapped with the particle-based dynamics
+        (zero in synchronous mode) """
+
+    def __init__(self):
+        super().__init__(name='advection_overlap', description="overlapped fraction of MPDATA compute time",
+                         unit="1")
+
+    def total(self):
+        return self.solvers.advection_time, self.solvers.wait_time
+
+    def get(self):
+        (advection_time, wait_time), (last_advection_time, last_wait_time) = self.total(), self.last
+        self.last = advection_time, wait_time
+        if self.solvers.asynchronous is False or advection_time == last_advection_time:
+            return 0.
+        return 1 - min(1., (wait_time - last_wait_time) / (advection_time - last_advection_time))
+
+
+class CondensationSubstepWallTime(Product):
+    """ wall time of `Condensation` (as measured by the core's timer read by `DynamicWallTime`) per
+        adaptive substep (counted as the mean over cells of the substeps taken in each timestep)
+        since the previous call to `get()` """
+
+    def __init__(self):
+        super().__init__(name='Condensation_wall_time_per_substep', unit="s",
+                         description="Condensation wall time per substep")
+        self.time = 0.
+        self.substeps = 0
+
+    def register(self, builder):
+        super().register(builder)
+        self.shape = ()
+        self.core.observers.append(self)
+
+    def notify(self):
+        self.time += self.core.timers['Condensation'].time
+        self.substeps += float(np.mean(self.core.dynamics['Condensation'].counters['n_substeps'].to_ndarray()))
+
+    def get(self):
+        result = self.time / self.substeps if self.substeps > 0 else np.nan
+        self.time = 0.
+        self.substeps = 0
+        return result
+
+
+def is_timing_product(product) -> bool:
+    """ whether `product` measures the run itself (wall or CPU time) rather than the simulated state """
+    return isinstance(product, (CPUTime, WallTime, PySDM_products.DynamicWallTime,
+                                _AdvectionTimer, CondensationSubstepWallTime))
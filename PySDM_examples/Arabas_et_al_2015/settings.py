@@ -57,6 +57,12 @@ class Settings:
         self.dt = 5 * si.second
         self.spin_up_time = 1 * si.hour
 
+        # per-product OutputPolicy (time stride and (x, z) window), keyed by product name
+        self.output_policies = {}
+
+        # model time between checkpoints written along with the output (see Simulation.resume); 0 = none
+        self.checkpoint_interval = 0
+
         self.v_bins = phys.volume(np.logspace(np.log10(0.001 * si.micrometre), np.log10(100 * si.micrometre), 101, endpoint=True))
 
         self.mode_1 = Lognormal(
@@ -86,6 +92,13 @@ class Settings:
         self.mpdata_iga = True
         self.mpdata_fct = True
         self.mpdata_tot = True
+        self.mpdata_concurrent = False
+        self.mpdata_asynchronous = False
+
+        # in asynchronous MPDATA mode: fraction of the numba threads given to the MPDATA stepper (the rest
+        # is left to the particle-based dynamics; None = no split) and optional adaptive split
+        self.threads_advection_share = None
+        self.threads_adaptive = False
 
         self.th_std0 = 289 * si.kelvins
         self.qv0 = 7.5 * si.grams / si.kilogram
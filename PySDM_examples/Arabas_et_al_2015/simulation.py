@@ -16,24 +16,53 @@ from PySDM.state.arakawa_c import Fields
 from .mpdata import MPDATA
 from .dummy_controller import DummyController
 from .spin_up import SpinUp
+from .output_policy import output_policy
+from .products import AdvectionTime, AdvectionWaitTime, AdvectionOverlap, CondensationSubstepWallTime, \
+    is_timing_product
+from .storage import Storage
+from .snapshot import Snapshot, SnapshotCache, spin_up_key
+from .thread_budget import ThreadBudget, threadsafe_layer
+from ..utils.dynamic_timers import DynamicTimes, summary_table
+from ..utils.throughput import ThroughputMeter
 import numpy as np
+import warnings
+import time
 
 
 class Simulation:
 
-    def __init__(self, settings, storage, backend=CPU):
+    def __init__(self, settings, storage, backend=CPU, sinks=(), snapshots: SnapshotCache = None):
+        """ with `snapshots` given, `reinit()` forks from the post-spin-up state of an earlier run
+            with the same spin-up-relevant settings (see `spin_up_key`), if there was one,
+            and otherwise `run()` adds a snapshot of the state at the end of spin-up to the cache """
         self.settings = settings
         self.storage = storage
+        self.sinks = list(sinks)
         self.core = None
         self.backend = backend
+        self.snapshots = snapshots
+        self.snapshot_key = None
+        self.attribute_names = ()
+        self.replay = {}
+        self.recording = None
+        self.resumed_step = None
+        self.last_checkpoint_step = 0
+        self.checkpoint_count = 0
+        self.checkpoint_time = 0
+        self.thread_budget = None
+        self.dynamic_times = None
+        self.timing_summary = None
 
     @property
     def products(self):
         return self.core.products
 
-    def reinit(self, products=None):
-
-        builder = Builder(n_sd=self.settings.n_sd, backend=self.backend)
+    def reinit(self, products=None, checkpoint: tuple = None):
+        """ `checkpoint` (output step and state, as returned by `Storage.load_checkpoint()`)
+            is meant to be passed by `resume()` """
+        resumed_step, state = checkpoint if checkpoint is not None else (None, None)
+        n_sd = self.settings.n_sd if state is None else len(state.attributes['n'])
+        builder = Builder(n_sd=n_sd, backend=self.backend)
         environment = Kinematic2D(dt=self.settings.dt,
                                   grid=self.settings.grid,
                                   size=self.settings.size,
@@ -42,6 +71,7 @@ class Simulation:
         builder.set_environment(environment)
 
         cloud_range = (self.settings.aerosol_radius_threshold, self.settings.drizzle_radius_threshold)
+        timing_products = not products
         if products is not None:
             products = list(products)
         products = products or [
@@ -88,13 +118,30 @@ class Simulation:
             products.append(PySDM_products.CondensationTimestepMin())  # TODO #37 and what if a user doesn't want it?
             products.append(PySDM_products.CondensationTimestepMax())
         if self.settings.processes['fluid advection']:
+            asynchronous = self.settings.mpdata_asynchronous
+            concurrent = self.settings.mpdata_concurrent
+            if (asynchronous or concurrent) and not threadsafe_layer():
+                warnings.warn("no thread-safe numba threading layer (tbb or omp) available: advecting synchronously")
+                asynchronous = concurrent = False
             solver = MPDATA(
                 fields=fields,
                 n_iters=self.settings.mpdata_iters,
                 infinite_gauge=self.settings.mpdata_iga,
                 flux_corrected_transport=self.settings.mpdata_fct,
-                third_order_terms=self.settings.mpdata_tot
+                third_order_terms=self.settings.mpdata_tot,
+                concurrent=concurrent
             )
+            # th and qv are advected in the background while displacement and coalescence run;
+            # condensation writes to separate (predicted) fields copied in before the next step
+            solver.asynchronous = asynchronous
+            if solver.asynchronous:
+                products.extend((AdvectionTime(), AdvectionWaitTime(), AdvectionOverlap()))
+            self.thread_budget = None
+            share = getattr(self.settings, 'threads_advection_share', None)
+            if solver.asynchronous and not concurrent and share is not None:
+                self.thread_budget = ThreadBudget(advection_share=share, adaptive=self.settings.threads_adaptive)
+                solver.thread_budget = self.thread_budget
+                solver.set_n_threads(self.thread_budget.advection_threads)
             builder.add_dynamic(EulerianAdvection(solver))
         if self.settings.processes["particle advection"]:
             displacement = Displacement(
@@ -116,29 +163,207 @@ class Simulation:
             products.append(PySDM_products.CollisionRate())
             products.append(PySDM_products.CollisionRateDeficit())
 
-        attributes = environment.init_attributes(spatial_discretisation=spatial_sampling.Pseudorandom(),
-                                                 spectral_discretisation=spectral_sampling.ConstantMultiplicity(
-                                                     spectrum=self.settings.spectrum_per_mass_of_dry_air
-                                                 ),
-                                                 kappa=self.settings.kappa)
+        if timing_products:
+            products.extend(PySDM_products.DynamicWallTime(name) for name in builder.core.dynamics)
+            if self.settings.processes["condensation"] and self.settings.condensation_adaptive:
+                products.append(CondensationSubstepWallTime())
+
+        snapshot = state
+        self.replay = {}
+        self.recording = None
+        self.resumed_step = resumed_step
+        self.last_checkpoint_step = resumed_step or 0
+        self.checkpoint_count = 0
+        self.checkpoint_time = 0
+        if self.snapshots is not None and state is None:
+            self.snapshot_key = spin_up_key(self.settings, products, self.backend)
+            snapshot = self.snapshots.get(self.snapshot_key)
+            if snapshot is None:
+                self.recording = {}
+
+        if snapshot is None:
+            attributes = environment.init_attributes(spatial_discretisation=spatial_sampling.Pseudorandom(),
+                                                     spectral_discretisation=spectral_sampling.ConstantMultiplicity(
+                                                         spectrum=self.settings.spectrum_per_mass_of_dry_air
+                                                     ),
+                                                     kappa=self.settings.kappa)
+        else:
+            attributes = {name: np.copy(data) for name, data in snapshot.attributes.items()}
+        self.attribute_names = tuple(attributes.keys())
 
         self.core = builder.build(attributes, products)
-        SpinUp(self.core, self.settings.n_spin_up)
-        if self.storage is not None:
-            self.storage.init(self.settings)
+        self.dynamic_times = DynamicTimes(self.core)
+        spin_up = SpinUp(self.core, self.settings.n_spin_up)
+        if snapshot is not None:
+            snapshot.restore(self.core)
+            if self.core.n_steps >= self.settings.n_spin_up:
+                spin_up.finish()
+            self.replay = snapshot.outputs
+        for sink in (self.storage, *self.sinks):
+            if sink is None:
+                continue
+            if resumed_step is None:
+                sink.init(self.settings)
+            else:
+                sink.resume(self.settings, resumed_step)
 
-    def run(self, controller=DummyController()):
+    def resume(self, path=None, products=None, controller=None):
+        """ continues an interrupted `run()` from the last checkpoint (see `Settings.checkpoint_interval`)
+            found in the directory `path` (by default that of `self.storage`, which has to hold the output
+            of the interrupted run), i.e. from the last output step stored consistently before it;
+            `products` have to be the same as passed to `reinit()` for the interrupted run """
+        checkpoint = Storage.load_checkpoint(self.storage.dir_path if path is None else path)
+        self.reinit(products, checkpoint=checkpoint)
+        self.run(controller)
+
+    def run(self, controller=None):
+        if controller is None:
+            controller = DummyController()
+        meter = getattr(controller, 'meter', None)
+        if isinstance(meter, ThroughputMeter):
+            meter.configure(n_sd=self.core.n_sd, n_steps=self.settings.output_steps[-1] - self.core.n_steps)
+        else:
+            meter = None
         with controller:
-            for step in self.settings.output_steps:
-                if controller.panic:
-                    break
+            if self.thread_budget is not None:
+                self.thread_budget.enter_particles()
+            t0 = time.perf_counter()
+            initial_times, initial_steps = dict(self.dynamic_times.time), self.dynamic_times.steps
+            try:
+                for step in self.settings.output_steps:
+                    if controller.panic:
+                        break
+
+                    if self.resumed_step is not None and step <= self.resumed_step:
+                        continue
+                    n_steps, t_compute = self.core.n_steps, time.perf_counter()
+                    t_storage = t_compute
+                    if step in self.replay:
+                        self._save(step, self._replayed(step))
+                    else:
+                        n_spin_up = self.settings.n_spin_up
+                        if self.recording is not None and step > n_spin_up > self.core.n_steps:
+                            self.core.run(n_spin_up - self.core.n_steps)
+                            self._take_snapshot()
 
-                self.core.run(step - self.core.n_steps)
+                        if self.thread_budget is None:
+                            self.core.run(step - self.core.n_steps)
+                        else:
+                            self._run_budgeted(step - self.core.n_steps)
 
-                self.store(step)
+                        t_storage = time.perf_counter()
+                        self.store(step)
+                        if self.recording is not None and self.core.n_steps == n_spin_up:
+                            self._take_snapshot()
+                        if self._checkpoint_due(step):
+                            self.checkpoint(step)
+                    if meter is not None:
+                        meter.add(steps=self.core.n_steps - n_steps, compute_time=t_storage - t_compute,
+                                  storage_time=time.perf_counter() - t_storage)
 
-                controller.set_percent(step / self.settings.output_steps[-1])
+                    controller.set_percent(step / self.settings.output_steps[-1])
+
+                steps = self.dynamic_times.steps - initial_steps
+                self.timing_summary = summary_table(
+                    {name: t - initial_times[name] for name, t in self.dynamic_times.time.items()},
+                    {name: steps for name in self.dynamic_times.time},
+                    time.perf_counter() - t0
+                )
+                if hasattr(controller, 'summary'):
+                    controller.summary(self.timing_summary)
+            finally:
+                if 'EulerianAdvection' in self.core.dynamics:
+                    self.core.dynamics['EulerianAdvection'].solvers.wait()
+                if self.thread_budget is not None:
+                    self.thread_budget.restore()
+                for sink in (self.storage, *self.sinks):
+                    sink.flush()
+
+    def _run_budgeted(self, steps):
+        """ `core.run()` feeding the (asynchronous) MPDATA compute time and the time the particle-based
+            dynamics took (wall time less waiting for MPDATA) to the thread budget, adjusting the split """
+        solvers = self.core.dynamics['EulerianAdvection'].solvers
+        advection_time, wait_time = solvers.advection_time, solvers.wait_time
+        t0 = time.perf_counter()
+        self.core.run(steps)
+        wall_time = time.perf_counter() - t0
+        particle_time = wall_time - (solvers.wait_time - wait_time)
+        if self.thread_budget.rebalance(solvers.advection_time - advection_time, particle_time):
+            solvers.set_n_threads(self.thread_budget.advection_threads)
+            self.thread_budget.enter_particles()
 
     def store(self, step):
+        output_index = int(np.searchsorted(self.settings.output_steps, step))
+        outputs = {}
         for name, product in self.core.products.items():
-            self.storage.save(product.get(), step, name)
+            policy = output_policy(self.settings, name)
+            if not policy.stores(output_index):
+                continue
+            outputs[name] = policy.crop(product.get())
+        self._save(step, outputs)
+        if self.recording is not None:
+            self.recording[step] = {
+                name: data if isinstance(data, (int, float)) else np.copy(data) for name, data in outputs.items()
+            }
+
+    def _replayed(self, step) -> dict:
+        """ outputs recorded at `step` by the run the snapshot comes from, with NaN for the timing
+            products (which measure that run, not this one) """
+        return {
+            name: np.nan if is_timing_product(self.core.products[name]) else data
+            for name, data in self.replay[step].items()
+        }
+
+    def _save(self, step, outputs: dict):
+        for name, data in outputs.items():
+            self.storage.save(data, step, name)
+            for sink in self.sinks:
+                sink.save(data, step, name)
+        self.storage.commit(step)
+        for sink in self.sinks:
+            sink.commit(step)
+
+    def _checkpoint_due(self, step) -> bool:
+        interval = getattr(self.settings, 'checkpoint_interval', 0)
+        if interval <= 0 or step == self.settings.output_steps[-1]:
+            return False
+        return step - self.last_checkpoint_step >= max(1, int(interval / self.settings.dt))
+
+    def checkpoint(self, step):
+        """ hands the state after output `step` to the storage which writes it after the output
+            (`checkpoint_time` accumulates the time the simulation spends on it, which for an
+            `AsyncStorage` excludes the pickling and writing done in the background) """
+        t0 = time.perf_counter()
+        self.storage.checkpoint(Snapshot.take(self.core, self.attribute_names, {}, checkpoint=True), step)
+        self.checkpoint_time += time.perf_counter() - t0
+        self.checkpoint_count += 1
+        self.last_checkpoint_step = step
+
+    def _take_snapshot(self):
+        self.snapshots.put(self.snapshot_key, Snapshot.take(self.core, self.attribute_names, self.recording))
+        self.recording = None
+
+
+class _WarmUpSettings:
+    """ the given settings with one super-droplet per cell, a single spin-up step and two steps after """
+
+    def __init__(self, settings):
+        self._settings = settings
+        self.n_sd = int(np.prod(settings.grid))
+        self.n_spin_up = 1
+        self.output_steps = np.arange(0, 3)
+
+    def __getattr__(self, item):
+        return getattr(self._settings, item)
+
+
+def warmup(settings, backend=CPU) -> float:
+    """ triggers, in the current process, the JIT compilation of all the kernels (dynamics, products
+        and the MPDATA stepper for the given grid) that a `Simulation` with `settings` uses,
+        by running a few steps with a minimal number of super-droplets; returns the time it took
+        (combine with `utils.jit_cache.enable_jit_cache()` to amortise it across processes) """
+    t0 = time.perf_counter()
+    simulation = Simulation(_WarmUpSettings(settings), Storage(), backend)
+    simulation.reinit()
+    simulation.run()
+    return time.perf_counter() - t0
@@ -0,0 +1,143 @@
+"""
+Created at 18.10.2026
+"""
+
+import os
+import uuid
+import pickle
+import hashlib
+import numpy as np
+from pathlib import Path
+from .output_policy import output_policy
+
+SPIN_UP_SETTINGS = (
+    'versions', 'grid', 'size', 'dt', 'n_sd', 'n_spin_up',
+    'th_std0', 'qv0', 'p0', 'g', 'rho_w_max', 'kappa', 'spectrum_per_mass_of_dry_air',
+    'condensation_rtol_x', 'condensation_rtol_thd', 'condensation_coord', 'condensation_adaptive',
+    'condensation_substeps', 'condensation_dt_cond_range', 'condensation_schedule',
+    'mpdata_iters', 'mpdata_iga', 'mpdata_fct', 'mpdata_tot', 'enable_particle_temperatures',
+    'v_bins', 'aerosol_radius_threshold', 'drizzle_radius_threshold'
+)
+""" settings on which the state after spin-up (and the outputs stored during it) depend - coalescence
+    and sedimentation are disabled during spin-up (see `SpinUp`) so their settings are not included """
+
+
+def spin_up_key(settings, products, backend) -> str:
+    values = {name: getattr(settings, name, None) for name in SPIN_UP_SETTINGS}
+    values['processes'] = {
+        process: enabled for process, enabled in settings.processes.items()
+        if process not in ('coalescence', 'sedimentation')
+    }
+    values['spin_up_outputs'] = [int(step) for step in settings.output_steps if step <= settings.n_spin_up]
+    values['output_policies'] = {
+        product.name: (output_policy(settings, product.name).stride, output_policy(settings, product.name).window)
+        for product in products
+    }
+    values['products'] = sorted(product.name for product in products)
+    values['backend'] = getattr(backend, '__name__', str(backend))
+    return hashlib.sha1(pickle.dumps(values)).hexdigest()
+
+
+def _counters(core) -> dict:
+    """ per-cell counters kept by the dynamics (e.g. the substep counts adaptive condensation starts from) """
+    result = {}
+    for name, dynamic in core.dynamics.items():
+        for counter, storage in getattr(dynamic, 'counters', {}).items():
+            result[f"{name}.{counter}"] = storage
+    return result
+
+
+def _random_generators(core) -> dict:
+    """ numpy random generators held by the dynamics (or their direct members), keyed by their path """
+    result = {}
+    for name, dynamic in core.dynamics.items():
+        for attr, value in vars(dynamic).items():
+            members = vars(value).items() if hasattr(value, '__dict__') else ()
+            for path, candidate in ((f"{name}.{attr}", value), *((f"{name}.{attr}.{k}", v) for k, v in members)):
+                if isinstance(candidate, np.random.Generator):
+                    result[path] = candidate
+    return result
+
+
+class Snapshot:
+    """ state of a `Simulation` after a given step: particle attributes (of the super-droplets
+        still in the domain), MPDATA advectees, per-cell counters of the dynamics (including the
+        substep counts adaptive condensation continues from), step counter and, if requested, the
+        states of the random number generators; when taken at the end of spin-up, also the outputs
+        stored during spin-up (replayed when forking, except for the timing products - see
+        `Simulation.run()`; the random states are not needed there as coalescence is disabled
+        during spin-up) """
+
+    def __init__(self, n_steps: int, attributes: dict, advectees: dict, outputs: dict, random_states: dict = None,
+                 counters: dict = None):
+        self.n_steps = n_steps
+        self.attributes = attributes
+        self.advectees = advectees
+        self.outputs = outputs
+        self.random_states = random_states or {}
+        self.counters = counters or {}
+
+    @staticmethod
+    def take(core, attribute_names, outputs: dict, checkpoint: bool = False) -> 'Snapshot':
+        attributes = {name: core.particles[name].to_ndarray() for name in attribute_names}
+        valid = attributes['n'] > 0
+        if not np.all(valid):
+            if not checkpoint:
+                raise NotImplementedError("super-droplets were removed during spin-up")
+            attributes = {name: data[..., valid] for name, data in attributes.items()}
+        advectees = {}
+        if 'EulerianAdvection' in core.dynamics:
+            solvers = core.dynamics['EulerianAdvection'].solvers
+            solvers.wait()
+            advectees = {k: np.copy(solver.advectee.get()) for k, solver in solvers.mpdatas.items()}
+        random_states = {}
+        if checkpoint:
+            random_states = {
+                path: generator.bit_generator.state for path, generator in _random_generators(core).items()
+            }
+        counters = {path: storage.to_ndarray() for path, storage in _counters(core).items()}
+        return Snapshot(core.n_steps, attributes, advectees, outputs, random_states, counters)
+
+    def restore(self, core):
+        """ sets the step counter, advectees, counters and random states of a core built from `self.attributes` """
+        core.n_steps = self.n_steps
+        if 'EulerianAdvection' in core.dynamics:
+            for k, solver in core.dynamics['EulerianAdvection'].solvers.mpdatas.items():
+                solver.advectee.get()[:] = self.advectees[k]
+        counters = _counters(core)
+        for path, data in getattr(self, 'counters', {}).items():  # absent in snapshots pickled before
+            counters[path].upload(data)
+        generators = _random_generators(core)
+        for path, state in self.random_states.items():
+            generators[path].bit_generator.state = state
+
+
+class SnapshotCache:
+    """ post-spin-up snapshots keyed by `spin_up_key`, kept in memory and, if `path` is given,
+        in `<path>/<key>.pkl` files (to be shared across processes and sessions) """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.snapshots = {}
+        if path is not None:
+            Path(path).mkdir(parents=True, exist_ok=True)
+
+    def __len__(self):
+        return len(self.snapshots)
+
+    def _filepath(self, key):
+        return os.path.join(self.path, f"{key}.pkl")
+
+    def get(self, key: str) -> (Snapshot, None):
+        if key not in self.snapshots and self.path is not None and os.path.exists(self._filepath(key)):
+            with open(self._filepath(key), 'rb') as file:
+                self.snapshots[key] = pickle.load(file)
+        return self.snapshots.get(key)
+
+    def put(self, key: str, snapshot: Snapshot):
+        self.snapshots[key] = snapshot
+        if self.path is not None:
+            tmp_path = f"{self._filepath(key)}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, 'wb') as file:
+                pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._filepath(key))
@@ -18,8 +18,11 @@ class SpinUp:
 
     def notify(self):
         if self.particles.n_steps == self.spin_up_steps:
-            self.set(Coalescence, 'enable', True)
-            self.set(Displacement, 'enable_sedimentation', True)
+            self.finish()
+
+    def finish(self):
+        self.set(Coalescence, 'enable', True)
+        self.set(Displacement, 'enable_sedimentation', True)
 
     def set(self, dynamic, attr, value):
         key = dynamic.__name__
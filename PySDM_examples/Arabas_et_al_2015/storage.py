@@ -3,16 +3,73 @@ Created at 02.10.2019
 """
 
 import os
+import json
+import bisect
+import uuid
+import pickle
 import tempfile
 import numpy as np
 from pathlib import Path
+from .output_policy import output_policy
+
+
+def _publish(path: str, write):
+    """ writes through a temporary file and atomically renames it, so that concurrent readers
+        see either the previous or the complete new file (never a torn one) """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'wb') as file:
+        write(file)
+    os.replace(tmp_path, path)
+
+
+class TimeSeries:
+    """ append-only scalar series: amortised O(1) appends into a preallocated (doubling) buffer,
+        mirrored to a raw binary file which is only ever appended to (through an unbuffered
+        handle kept open until `close()`, so each append is a single write call) """
+
+    def __init__(self, path: str, dtype, capacity: int, length: int = 0):
+        """ with non-zero `length`, continues the series from its first `length` values in the file """
+        self.path = path
+        self.data = np.empty(max(capacity, length, 1), dtype=dtype)
+        self.length = length
+        self.file = None
+        if length == 0:
+            _publish(self.path, lambda _: None)
+        else:
+            self.data[:length] = np.fromfile(self.path, dtype=dtype, count=length)
+            os.truncate(self.path, length * self.data.itemsize)
+
+    def __len__(self):
+        return self.length
+
+    def append(self, value):
+        if self.length == len(self.data):
+            self.data = np.concatenate((self.data, np.empty_like(self.data)))
+        self.data[self.length] = value
+        if self.file is None:
+            self.file = open(self.path, 'ab', buffering=0)
+        self.file.write(self.data[self.length:self.length + 1].tobytes())
+        self.length += 1
+
+    def close(self):
+        """ releases the file handle (reopened by the next `append()`) """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def view(self, start: int = 0) -> np.ndarray:
+        result = self.data[start:self.length]
+        result.flags.writeable = False
+        return result
 
 
 class Storage:
     class Exception(BaseException):
         pass
 
-    def __init__(self, dtype=np.float32, path=None):
+    def __init__(self, dtype=np.float32, path=None, memmap=False, codec=None):
+        if memmap and codec is not None:
+            raise ValueError("memmap and codec storage modes are mutually exclusive")
         if path is None:
             self.temp_dir = tempfile.TemporaryDirectory()
             self.dir_path = self.temp_dir.name
@@ -21,35 +78,329 @@ class Storage:
             self.dir_path = Path(path).absolute()
         self.dtype = dtype
         self.grid = None
+        self.settings = None
+        self.timeseries = {}
+        self.memmap = memmap
+        self.step_index = {}
+        self.fields = {}
+        self.saved = {}
+        self.codec = codec
+        self.decoded = {}
+        self.written = {}
+        self.manifest = {}
+        self.products = {}
 
     def __del__(self):
+        self._close()
+        self.fields = {}
         if hasattr(self, 'temp_dir'):
             self.temp_dir.cleanup()
 
     def init(self, settings):
+        self._close()
+        self.grid = settings.grid
+        self.settings = settings
+        self.timeseries = {}
+        self.step_index = {}
+        self.fields = {}
+        self.saved = {}
+        self.decoded = {}
+        self.written = {}
+        if self.codec is not None:
+            self.codec.reset()
+        self.manifest = {
+            'run': uuid.uuid4().hex,
+            'dtype': np.dtype(self.dtype).name,
+            'mode': 'memmap' if self.memmap else 'codec' if self.codec is not None else 'npy',
+            'step': -1
+        }
+        self.products = {}
+        self._write_products()
+        self._write_manifest()
+
+    def resume(self, settings, step: int):
+        """ continues a run interrupted after output `step` from the data in the storage directory,
+            discarding anything saved past that step (counterpart of `init()`, see `Simulation.resume()`) """
+        self._close()
         self.grid = settings.grid
+        self.settings = settings
+        self.timeseries = {}
+        self.step_index = {}
+        self.fields = {}
+        self.saved = {}
+        self.decoded = {}
+        self.written = {}
+        if self.codec is not None:
+            self.codec.reset()  # the next saved step of each variable is a keyframe
+        with open(os.path.join(self.dir_path, 'manifest.json'), 'rb') as file:
+            self.manifest = json.loads(file.read())
+        with open(os.path.join(self.dir_path, 'products.json'), 'rb') as file:
+            self.products = json.loads(file.read())['products']
+        for name, product in self.products.items():
+            steps = [s for s in self._step_index(name) if s <= step]
+            if product['kind'] == 'timeseries':
+                self.timeseries[name] = TimeSeries(
+                    self._filepath(name, extension='bin'), self.dtype, len(self._step_index(name)), len(steps)
+                )
+                continue
+            self.written[name] = set(steps)
+            if self.memmap:
+                self.fields[name] = np.lib.format.open_memmap(self._filepath(name), mode='r+')
+                self.saved[name] = np.array([s <= step for s in self._step_index(name)])
+        self.commit(step)
+
+    def checkpoint(self, state, step: int):
+        """ atomically replaces the checkpoint (written after output `step` was committed) """
+        _publish(os.path.join(self.dir_path, 'checkpoint.pkl'),
+                 lambda file: pickle.dump((step, state), file, protocol=pickle.HIGHEST_PROTOCOL))
+        self.manifest['checkpoint'] = int(step)
+        self._write_manifest()
+
+    @staticmethod
+    def load_checkpoint(path) -> tuple:
+        """ returns the output step and the state stored by `checkpoint()` in the directory `path` """
+        try:
+            with open(os.path.join(path, 'checkpoint.pkl'), 'rb') as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            raise Storage.Exception()
+
+    def flush(self):
+        self._close()
+
+    def _close(self):
+        for series in self.timeseries.values():
+            series.close()
+
+    def commit(self, step: int):
+        """ publishes an output step (once all products have been saved) in the manifest
+            followed by `StorageReader`s in other threads or processes - only the last committed
+            step is rewritten, the time axes of products are published once (see `_register()`) """
+        self.manifest['step'] = int(step)
+        self._write_manifest()
+
+    def _register(self, name: str, kind: str):
+        """ publishes the time axis of a product when it is first saved in a run """
+        if name in self.products:
+            return
+        self.products[name] = {'kind': kind, 'time_axis': [int(s) for s in self._step_index(name)]}
+        self._write_products()
+
+    def _write_manifest(self):
+        _publish(
+            os.path.join(self.dir_path, 'manifest.json'),
+            lambda file: file.write(json.dumps(self.manifest).encode())
+        )
+
+    def _write_products(self):
+        record = {'run': self.manifest['run'], 'products': self.products}
+        _publish(
+            os.path.join(self.dir_path, 'products.json'),
+            lambda file: file.write(json.dumps(record).encode())
+        )
 
-    def _filepath(self, name: str, step: int = None):
+    def available(self, name: str, step: int = None) -> bool:
         if step is None:
-            filename = f"{name}.npy"
+            return name in self.timeseries and len(self.timeseries[name]) > 0
+        return step in self.written.get(name, ())
+
+    def _filepath(self, name: str, step: int = None, extension: str = 'npy'):
+        if step is None:
+            filename = f"{name}.{extension}"
         else:
-            filename = f"{name}_{step:06}.npy"
+            filename = f"{name}_{step:06}.{extension}"
         path = os.path.join(self.dir_path, filename)
         return path
 
+    def _step_index(self, name: str) -> dict:
+        """ maps output steps to indices along the time axis of a product (see `OutputPolicy`) """
+        if name not in self.step_index:
+            steps = output_policy(self.settings, name).steps(self.settings.output_steps)
+            self.step_index[name] = {step: index for index, step in enumerate(steps)}
+        return self.step_index[name]
+
     def save(self, data: (float, np.ndarray), step: int, name: str):
         if isinstance(data, (int, float)):
-            path = self._filepath(name)
-            np.save(path, np.concatenate((() if step == 0 else np.load(path), (self.dtype(data),))))
-        elif data.shape[0:2] == self.grid:
-            np.save(self._filepath(name, step), data.astype(self.dtype))
+            self._register(name, 'timeseries')
+            if step == 0 or name not in self.timeseries:
+                if name in self.timeseries:
+                    self.timeseries[name].close()
+                self.timeseries[name] = TimeSeries(
+                    self._filepath(name, extension='bin'), self.dtype, len(self._step_index(name))
+                )
+            self.timeseries[name].append(data)
+        elif data.shape[0:2] == output_policy(self.settings, name).shape(self.grid):
+            self._register(name, 'field')
+            if self.memmap:
+                self._save_field(data, step, name)
+            elif self.codec is not None:
+                path = self._filepath(name, step, extension='npz')
+                record = self.codec.encode(data, name, step)
+                _publish(path, lambda file: np.savez_compressed(file, **record))
+                self.codec.account_stored_bytes(name, os.path.getsize(path))
+            else:
+                _publish(self._filepath(name, step), lambda file: np.save(file, data.astype(self.dtype)))
+            self.written.setdefault(name, set()).add(step)
         else:
             raise NotImplementedError()
 
+    def _save_field(self, data: np.ndarray, step: int, name: str):
+        step_index = self._step_index(name)
+        if step not in step_index:
+            raise NotImplementedError()
+        if name not in self.fields or self.fields[name].shape[1:] != data.shape:
+            # a fresh file (not truncated in place) so that readers mapping the previous run stay valid
+            path = self._filepath(name)
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            self.fields[name] = np.lib.format.open_memmap(
+                tmp_path, mode='w+', dtype=self.dtype, shape=(len(step_index), *data.shape)
+            )
+            os.replace(tmp_path, path)
+            self.saved[name] = np.zeros(len(step_index), dtype=bool)
+        index = step_index[step]
+        self.fields[name][index] = data
+        self.saved[name][index] = True
+
     def load(self, name: str, step: int = None) -> np.ndarray:
+        if step is None:
+            return self.load_tail(name)
+        if self.memmap:
+            return self._load_field(name, step)
+        if self.codec is not None:
+            return self._load_encoded(name, step)
         try:
             data = np.load(self._filepath(name, step))
         except FileNotFoundError:
             raise Storage.Exception()
         return data
 
+    def _load_field(self, name: str, step: int) -> np.ndarray:
+        """ zero-copy read-only view of a single output step of a memory-mapped `(T, nx, nz[, bins])` field """
+        index = self._step_index(name).get(step)
+        if name not in self.fields or index is None or not self.saved[name][index]:
+            raise Storage.Exception()
+        result = self.fields[name][index]
+        result.flags.writeable = False
+        return result
+
+    def _load_encoded(self, name: str, step: int) -> np.ndarray:
+        """ decodes the delta chain back to the nearest keyframe, reusing the codes of the
+            last decoded step of the variable (sequential scrubbing costs one file read) """
+        chain = []
+        while True:
+            if name in self.decoded and self.decoded[name][0] == step:
+                data, codes = self.decoded[name][1:]
+                break
+            try:
+                with np.load(self._filepath(name, step, extension='npz')) as record:
+                    record = dict(record)
+            except FileNotFoundError:
+                raise Storage.Exception()
+            chain.append((step, record))
+            step = int(record['reference'])
+            if step == -1:
+                codes = None
+                break
+        for step, record in reversed(chain):
+            data, codes = self.codec.decode(record, codes)
+            self.decoded[name] = (step, data, codes)
+        return data.astype(self.dtype)
+
+    def load_tail(self, name: str, start: int = 0) -> np.ndarray:
+        """ read-only view of a scalar time series from the `start`-th output onwards (no copy) """
+        if name in self.timeseries:
+            return self.timeseries[name].view(start)
+        try:
+            data = np.fromfile(self._filepath(name, extension='bin'), dtype=self.dtype,
+                               offset=start * np.dtype(self.dtype).itemsize)
+        except FileNotFoundError:
+            raise Storage.Exception()
+        return data
+
+
+class StorageReader(Storage):
+    """ read-only access to a `Storage` directory written concurrently by another thread or process:
+        only data published in its manifest (see `Storage.commit`) is ever read, and checking for
+        new output steps costs a single `stat` call when nothing has changed """
+
+    def __init__(self, path, codec=None):
+        manifest_path = os.path.join(Path(path).absolute(), 'manifest.json')
+        with open(manifest_path, 'rb') as file:
+            manifest = json.loads(file.read())
+        super().__init__(dtype=np.dtype(manifest['dtype']).type, path=path,
+                         memmap=manifest['mode'] == 'memmap', codec=codec)
+        self.manifest_path = manifest_path
+        self.manifest_mtime = None
+        self.refresh()
+
+    def init(self, settings):
+        raise NotImplementedError()
+
+    def save(self, data: (float, np.ndarray), step: int, name: str):
+        raise NotImplementedError()
+
+    def commit(self, step: int):
+        raise NotImplementedError()
+
+    def refresh(self):
+        stat = os.stat(self.manifest_path)
+        mtime = (stat.st_mtime_ns, stat.st_ino)
+        if mtime == self.manifest_mtime:
+            return
+        with open(self.manifest_path, 'rb') as file:
+            manifest = json.loads(file.read())
+        if manifest['run'] != self.manifest.get('run'):
+            self.fields = {}
+            self.step_index = {}
+            self.decoded = {}
+            self.products = {}
+        self.manifest = manifest
+        self.manifest_mtime = mtime
+
+    def _product(self, name: str):
+        """ time axis and kind of a product, re-reading the product list if it is not (yet) known """
+        if name not in self.products:
+            with open(os.path.join(self.dir_path, 'products.json'), 'rb') as file:
+                record = json.loads(file.read())
+            if record['run'] == self.manifest['run']:
+                self.products = record['products']
+        return self.products.get(name)
+
+    def available(self, name: str, step: int = None) -> bool:
+        self.refresh()
+        product = self._product(name)
+        if product is None:
+            return False
+        if step is None:
+            return product['kind'] == 'timeseries' and self._length(product) > 0
+        return product['kind'] == 'field' and step <= self.manifest['step'] and step in self._step_index(name)
+
+    def _length(self, product: dict) -> int:
+        return bisect.bisect_right(product['time_axis'], self.manifest['step'])
+
+    def load(self, name: str, step: int = None) -> np.ndarray:
+        if not self.available(name, step):
+            raise Storage.Exception()
+        return super().load(name, step)
+
+    def load_tail(self, name: str, start: int = 0) -> np.ndarray:
+        self.refresh()
+        product = self._product(name)
+        if product is None or product['kind'] != 'timeseries':
+            raise Storage.Exception()
+        count = max(0, self._length(product) - start)
+        data = np.fromfile(self._filepath(name, extension='bin'), dtype=self.dtype, count=count,
+                           offset=start * np.dtype(self.dtype).itemsize)
+        data.flags.writeable = False
+        return data
+
+    def _step_index(self, name: str) -> dict:
+        if name not in self.step_index:
+            time_axis = self.products[name]['time_axis']
+            self.step_index[name] = {step: index for index, step in enumerate(time_axis)}
+        return self.step_index[name]
+
+    def _load_field(self, name: str, step: int) -> np.ndarray:
+        if name not in self.fields:
+            self.fields[name] = np.load(self._filepath(name), mmap_mode='r')
+        return self.fields[name][self._step_index(name)[step]]
@@ -0,0 +1,87 @@
+"""
+Created at 18.10.2026
+"""
+
+import numba
+
+_THREADSAFE_LAYERS = ('tbb', 'omp')
+
+
+@numba.njit(parallel=True)
+def _parallel_sum(n):
+    result = 0
+    for i in numba.prange(n):
+        result += i
+    return result
+
+
+def threadsafe_layer() -> bool:
+    """ whether numba parallel kernels may be launched from several threads at once (as with
+        asynchronous or concurrent MPDATA): unless numba has already chosen its threading layer,
+        requests one which allows it (`tbb` or `omp`); under `workqueue`, the fallback when
+        neither is available, numba aborts the process on concurrent parallel launches
+
+        note that numba loads its threading layer once per process, at the first parallel launch:
+        if that is this call, all parallel kernels of the process run on the layer chosen here
+        (`numba.config.THREADING_LAYER` itself is restored, so it is only the layer already
+        loaded which persists - a process wanting another one has to launch a kernel first) """
+    try:
+        return numba.threading_layer() in _THREADSAFE_LAYERS
+    except ValueError:  # not chosen yet
+        pass
+    previous = numba.config.THREADING_LAYER
+    numba.config.THREADING_LAYER = 'threadsafe'
+    try:
+        _parallel_sum(2)
+    except ValueError:  # neither tbb nor omp could be loaded
+        return False
+    finally:
+        numba.config.THREADING_LAYER = previous
+    return numba.threading_layer() in _THREADSAFE_LAYERS
+
+
+class ThreadBudget:
+    """ split of `n_threads` numba threads (by default all numba was started with) between
+        the MPDATA stepper run asynchronously on its own thread and the particle-based dynamics
+        run meanwhile on the main thread, so that the two do not oversubscribe the cores;
+        with `adaptive`, `rebalance()` moves threads towards the side which took longer
+        in the last measured steps (the split is a thread count only: numba's workers are
+        shared by both sides and cannot be bound to CPUs per calling thread) """
+
+    def __init__(self, n_threads: int = None, advection_share: float = .5,
+                 adaptive: bool = False, tolerance: float = .1):
+        self.n_threads = n_threads or numba.config.NUMBA_NUM_THREADS
+        self.advection_threads = min(max(1, round(advection_share * self.n_threads)), max(1, self.n_threads - 1))
+        self.adaptive = adaptive
+        self.tolerance = tolerance
+        self.history = []
+        self.initial_threads = numba.get_num_threads()
+
+    @property
+    def particle_threads(self) -> int:
+        return max(1, self.n_threads - self.advection_threads)
+
+    def enter_particles(self):
+        """ to be called from the thread running the particle-based dynamics """
+        numba.set_num_threads(min(self.particle_threads, numba.config.NUMBA_NUM_THREADS))
+
+    def enter_advection(self):
+        """ to be called from the thread running the MPDATA step """
+        numba.set_num_threads(min(self.advection_threads, numba.config.NUMBA_NUM_THREADS))
+
+    def restore(self):
+        numba.set_num_threads(self.initial_threads)
+
+    def rebalance(self, advection_time: float, particle_time: float) -> bool:
+        """ records the timings of the last steps and (if `adaptive`) moves one thread to the slower
+            side if it took longer by more than `tolerance` (relative); returns whether the split changed """
+        self.history.append((self.advection_threads, advection_time, particle_time))
+        if not self.adaptive:
+            return False
+        if advection_time > (1 + self.tolerance) * particle_time and self.particle_threads > 1:
+            self.advection_threads += 1
+        elif particle_time > (1 + self.tolerance) * advection_time and self.advection_threads > 1:
+            self.advection_threads -= 1
+        else:
+            return False
+        return True
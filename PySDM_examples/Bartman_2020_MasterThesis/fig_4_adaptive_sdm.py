@@ -3,8 +3,9 @@ Created at 20.08.2020
 """
 
 from PySDM_examples.Shima_et_al_2009.settings import Settings
-from PySDM_examples.Shima_et_al_2009.example import run
+from PySDM_examples.Shima_et_al_2009.replicas import run_replicas
 from PySDM_examples.Shima_et_al_2009.spectrum_plotter import SpectrumPlotter
+from PySDM_examples.utils.ensemble_statistics import EnsembleStatistics
 from matplotlib import pyplot as plt
 
 
@@ -19,24 +20,19 @@ def main(plot: bool = True, save: str = None):
 
     for i, dt in enumerate(dts):
         for j, n_sd in enumerate(n_sds):
-            outputs = []
-            exec_time = 0
-            for iter in range(iters):
-                settings = Settings()
+            statistics = EnsembleStatistics()
+            settings = Settings()
 
-                settings.n_sd = 2 ** n_sd
-                settings.dt = dt if dt != 'adaptive' else 10
-                settings.adaptive = dt == 'adaptive'
+            settings.n_sd = 2 ** n_sd
+            settings.dt = dt if dt != 'adaptive' else 10
+            settings.adaptive = dt == 'adaptive'
 
-                states, exec_time = run(settings)
-                outputs.append(states)
+            _, exec_time = run_replicas(settings, n_replicas=iters, sink=statistics)
             mean_time = exec_time / iters
             if base_time is None:
                 base_time = mean_time
             norm_time = mean_time / base_time
-            mean_output = {}
-            for key in outputs[0].keys():
-                mean_output[key] = sum((output[key] for output in outputs)) / len(outputs)
+            mean_output = {step: statistics.mean('dv/dlnr', step) for step in statistics.steps('dv/dlnr')}
 
             plotter = SpectrumPlotter(settings, legend=False)
             plotter.fig = fig
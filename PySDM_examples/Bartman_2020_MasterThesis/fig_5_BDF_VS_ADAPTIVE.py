@@ -2,10 +2,10 @@
 Created at 20.08.2020
 """
 
-from PySDM_examples.Arabas_and_Shima_2017.simulation import Simulation
 from PySDM_examples.Arabas_and_Shima_2017.settings import setups
-from PySDM.backends.numba import bdf
-    
+from PySDM_examples.Arabas_and_Shima_2017.sweep import run_setups
+
+import copy
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
@@ -16,28 +16,19 @@ def data(n_output, rtols, schemes, setups_num):
     resultant_data = {}
     for scheme in schemes:
         resultant_data[scheme] = {}
-        if scheme == 'BDF':
-            for rtol in rtols:
-                resultant_data[scheme][rtol] = []
+        sweep = []
+        for rtol in (rtols if scheme != 'BDF' else (None,)):
             for settings_idx in range(setups_num):
-                settings = setups[settings_idx]
-                settings.n_output = n_output
-                simulation = Simulation(settings)
-                bdf.patch_core(simulation.core, settings.coord)
-                results = simulation.run()
-                for rtol in rtols:
-                    resultant_data[scheme][rtol].append(results)
-        else:
-            for rtol in rtols:
-                resultant_data[scheme][rtol] = []
-                for settings_idx in range(setups_num):
-                    settings = setups[settings_idx]
+                settings = copy.copy(setups[settings_idx])
+                if rtol is not None:
                     settings.rtol_x = rtol
                     settings.rtol_thd = rtol
-                    settings.n_output = n_output
-                    simulation = Simulation(settings)
-                    results = simulation.run()
-                    resultant_data[scheme][rtol].append(results)
+                settings.n_output = n_output
+                sweep.append(settings)
+        results = run_setups(sweep, bdf=scheme == 'BDF')
+        for rtol_idx, rtol in enumerate(rtols):
+            offset = 0 if scheme == 'BDF' else rtol_idx * setups_num
+            resultant_data[scheme][rtol] = results[offset:offset + setups_num]
     return resultant_data
 
 
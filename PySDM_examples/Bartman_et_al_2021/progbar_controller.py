@@ -1,12 +1,15 @@
 from PySDM_examples.utils.widgets import display, FloatProgress
+from PySDM_examples.utils.throughput import ThroughputMeter
 
 
 class ProgBarController:
-    def __init__(self, description=''):
+    def __init__(self, description='', metrics=None):
         self.progress = FloatProgress(value=0.0, min=0.0, max=1.0, description=description)
         self.panic = False
+        self.meter = ThroughputMeter(metrics, label=description or None)
 
     def __enter__(self):
+        self.meter.start()
         self.set_percent(0)
         display(self.progress)
 
@@ -15,3 +18,4 @@ class ProgBarController:
 
     def set_percent(self, value):
         self.progress.value = value
+        self.meter.update(value)
@@ -9,9 +9,11 @@ from PySDM_examples.Berry_1967.settings import Settings
 from PySDM_examples.Berry_1967.spectrum_plotter import SpectrumPlotter
 from PySDM.attributes.physics.terminal_velocity import gunn_and_kinzer
 from PySDM_examples.Shima_et_al_2009.example import run
+from PySDM_examples.utils.result_cache import ResultCache
 
 
-def main(plot: bool, save):
+def main(plot: bool, save, cache_dir: str = None):
+    cached_run = run if cache_dir is None else ResultCache(cache_dir).memoize(run)
     with np.errstate(all='ignore'):
 
         u_term_approxs = (gunn_and_kinzer.Interpolation,)
@@ -41,7 +43,7 @@ def main(plot: bool, save):
             for dt in setups[u_term_approx]:
                 states[u_term_approx][dt] = {}
                 for kernel in setups[u_term_approx][dt]:
-                    states[u_term_approx][dt][kernel], _ = run(setups[u_term_approx][dt][kernel])
+                    states[u_term_approx][dt][kernel], _ = cached_run(setups[u_term_approx][dt][kernel])
 
     if plot or save is not None:
         for u_term_approx in setups:
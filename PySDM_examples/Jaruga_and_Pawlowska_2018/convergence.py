@@ -0,0 +1,77 @@
+"""
+Created at 18.10.2026
+"""
+
+import time
+import numpy as np
+from PySDM_examples.Kreidenweis_et_al_2003 import Simulation
+
+
+def relative_change(value, previous) -> float:
+    if value == previous:
+        return 0.
+    return abs(value - previous) / max(abs(value), abs(previous))
+
+
+def warm_up_run(simulation):
+    """ compile-only warm-up: a single time step and a single evaluation of each product
+        (the whole `run()` for simulations not exposing their `core`) """
+    if not hasattr(simulation, 'core'):
+        simulation.run()
+        return
+    simulation.core.run(steps=1)
+    for product in simulation.core.products.values():
+        product.get()
+
+
+def convergence_sweep(make_settings, n_sds, diagnostics: dict, rtol: float,
+                      simulation_class=Simulation, warm_up: bool = True) -> list:
+    """ runs `simulation_class(make_settings(n_sd))` for the subsequent `n_sds` (in increasing order)
+        within one process (so that JIT-compiled kernels are shared by all runs; with `warm_up`, the
+        cheapest configuration is advanced by one step beforehand - see `warm_up_run()` - so that
+        compilation is not billed to it),
+        evaluating the `diagnostics` (dict of name: function of the output) after each run and
+        stopping once all of them changed by less than `rtol` (relative) with respect to the previous
+        run; returns one dict per run with `n_sd`, `settings`, `output`, `diagnostics`, `change`
+        (relative change of each diagnostic, None for the first run), `wall_time` and `converged` """
+    if warm_up:
+        warm_up_run(simulation_class(make_settings(n_sds[0])))
+
+    runs = []
+    for n_sd in n_sds:
+        settings = make_settings(n_sd)
+        t0 = time.perf_counter()
+        output = simulation_class(settings).run()
+        wall_time = time.perf_counter() - t0
+
+        values = {name: diagnostic(output) for name, diagnostic in diagnostics.items()}
+        change = None
+        if runs:
+            change = {name: relative_change(value, runs[-1]['diagnostics'][name]) for name, value in values.items()}
+        runs.append({
+            'n_sd': n_sd, 'settings': settings, 'output': output, 'diagnostics': values,
+            'change': change, 'wall_time': wall_time,
+            'converged': change is not None and all(c < rtol for c in change.values())
+        })
+        if runs[-1]['converged']:
+            break
+    return runs
+
+
+def cost_vs_accuracy(runs: list) -> str:
+    """ table of the cumulative wall time against the relative change of the diagnostics """
+    names = list(runs[0]['diagnostics'].keys())
+    header = f"{'n_sd':>8} {'wall time [s]':>14} {'cumulative [s]':>15}" + ''.join(f" {name:>14}" for name in names)
+    lines = [header]
+    cumulative = 0
+    for run in runs:
+        cumulative += run['wall_time']
+        changes = ''.join(
+            f" {'-' if run['change'] is None else format(run['change'][name], '.2e'):>14}" for name in names
+        )
+        lines.append(f"{run['n_sd']:>8} {run['wall_time']:>14.3f} {cumulative:>15.3f}" + changes)
+    return '\n'.join(lines)
+
+
+def nanmax_of(key):
+    return lambda output: np.nanmax(output[key])
@@ -0,0 +1,93 @@
+"""
+Created at 18.10.2026
+"""
+
+import numpy as np
+
+from PySDM.backends import CPU
+from PySDM.builder import Builder
+from PySDM.environments import Box
+from PySDM.dynamics import Coalescence
+from PySDM.initialisation.spectral_sampling import ConstantMultiplicity
+from PySDM.physics.formulae import volume
+from PySDM.products.product import Product
+from PySDM.products.stats.timers import WallTime
+from PySDM.state.mesh import Mesh
+
+
+class ReplicaBox(Box):
+    """ `Box` environment holding `n_replicas` statistically independent realisations, each in its
+        own cell of volume `dv` (coalescence pairs super-droplets within cells only) """
+
+    def __init__(self, dt, dv, n_replicas: int):
+        super().__init__(dt=dt, dv=dv)
+        self.n_replicas = n_replicas
+        self.mesh = Mesh(grid=(n_replicas,), size=(n_replicas * dv,))
+
+    def init_attributes(self, spectral_discretisation, n_sd_per_replica: int) -> dict:
+        attributes = {}
+        sample_volume, sample_n = spectral_discretisation.sample(n_sd_per_replica)
+        attributes['volume'] = np.tile(sample_volume, self.n_replicas)
+        attributes['n'] = np.tile(sample_n, self.n_replicas)
+        attributes['cell id'] = np.repeat(np.arange(self.n_replicas, dtype=np.int64), n_sd_per_replica)
+        return attributes
+
+
+class ReplicaVolumeSpectrum(Product):
+    """ `ParticlesVolumeSpectrum` evaluated separately for each replica (cell) """
+
+    def __init__(self):
+        super().__init__(name='dv/dlnr', unit='1/(unit dr/r)',
+                         description='Particles volume distribution (per replica)')
+
+    def get(self, radius_bins_edges) -> np.ndarray:
+        """ returns an array of shape `(n_replicas, len(radius_bins_edges) - 1)` """
+        n_cell = self.core.mesh.n_cell
+        v = self.core.particles['volume'].to_ndarray()
+        vals, _, _ = np.histogram2d(
+            self.core.particles['cell id'].to_ndarray(), v,
+            bins=(np.arange(n_cell + 1), volume(radius_bins_edges)),
+            weights=self.core.particles['n'].to_ndarray() * v
+        )
+        vals *= 1 / np.diff(np.log(radius_bins_edges)) / self.core.mesh.dv
+        return vals
+
+
+def run_replicas(settings, n_replicas: int, backend=CPU, observers=(), sink=None):
+    """ as `example.run()` but for `n_replicas` realisations advanced together in one core
+        (with `settings.n_sd` super-droplets each); returns per-step spectra of shape
+        `(n_replicas, n_bins)` and the wall time spent on all replicas - unless a storage `sink`
+        (e.g. `EnsembleStatistics`) is given, which then gets each replica's spectrum saved
+        as soon as an output step is done (nothing is kept and the returned spectra are empty) """
+    builder = Builder(n_sd=n_replicas * settings.n_sd, backend=backend)
+    env = ReplicaBox(dv=settings.dv, dt=settings.dt, n_replicas=n_replicas)
+    builder.set_environment(env)
+    attributes = env.init_attributes(ConstantMultiplicity(settings.spectrum), settings.n_sd)
+    builder.add_dynamic(Coalescence(settings.kernel, adaptive=settings.adaptive))
+    products = [ReplicaVolumeSpectrum(), WallTime()]
+    core = builder.build(attributes, products)
+    if hasattr(settings, 'u_term') and 'terminal velocity' in core.particles.attributes:
+        core.particles.attributes['terminal velocity'].approximation = settings.u_term(core)
+
+    for observer in observers:
+        core.observers.append(observer)
+
+    if sink is not None:
+        sink.init(settings)
+    vals = {}
+    core.products['wall_time'].reset()
+    for step in settings.output_steps:
+        core.run(step - core.n_steps)
+        spectra = core.products['dv/dlnr'].get(settings.radius_bins_edges)
+        spectra[:] *= settings.rho
+        if sink is None:
+            vals[step] = spectra
+            continue
+        for replica_spectrum in spectra:
+            sink.save(replica_spectrum, step, 'dv/dlnr')
+        sink.commit(step)
+
+    exec_time = core.products['wall_time'].get()
+    if sink is not None:
+        sink.flush()
+    return vals, exec_time
@@ -1,6 +1,7 @@
-from PyMPDATA import Solver, Stepper, Options, ScalarField, VectorField, ExtrapolatedBoundaryCondition
+from PyMPDATA import Solver, ScalarField, VectorField, ExtrapolatedBoundaryCondition
 from PySDM.state import arakawa_c
 from numba.core.errors import NumbaExperimentalFeatureWarning
+from ..utils.jit_cache import cached_stepper
 import numpy as np
 
 
@@ -11,13 +12,15 @@ class MPDATA_1D:
         self.advector_of_t = advector_of_t
 
         grid = (nz,)
-        options = Options(
-            n_iters=mpdata_settings['n_iters'],
-            infinite_gauge=mpdata_settings['iga'],
-            flux_corrected_transport=mpdata_settings['fct'],
-            third_order_terms=mpdata_settings['tot']
+        options, stepper = cached_stepper(
+            dict(
+                n_iters=mpdata_settings['n_iters'],
+                infinite_gauge=mpdata_settings['iga'],
+                flux_corrected_transport=mpdata_settings['fct'],
+                third_order_terms=mpdata_settings['tot']
+            ),
+            grid=grid, non_unit_g_factor=True
         )
-        stepper = Stepper(options=options, grid=grid, non_unit_g_factor=True)
         bcs = (ExtrapolatedBoundaryCondition(),)
         g_factor = ScalarField(
             data=g_factor_of_zZ(arakawa_c.z_scalar_coord(grid)),
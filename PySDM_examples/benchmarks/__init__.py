@@ -0,0 +1,3 @@
+from .cases import Case, CASES
+from .suite import measure, run_suite, compare, save, load
+from .scaling import scaling, scaling_table
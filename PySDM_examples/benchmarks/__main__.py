@@ -0,0 +1,83 @@
+"""
+Created at 18.10.2026
+"""
+
+import sys
+import argparse
+from PySDM.backends import CPU, GPU
+from .cases import CASES
+from .suite import run_suite, compare, save, load, metadata
+from .isolated import configurations, run_matrix
+from .scaling import SCALING_CASES, scaling, scaling_table
+from PySDM_examples.utils.numba_conf import PARALLEL_MODES, parallel_mode
+
+
+def _parallel_mode(value: str):
+    try:
+        return parallel_mode(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from e
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m PySDM_examples.benchmarks')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="measure the benchmark cases and write the results as JSON")
+    run.add_argument('--cases', nargs='+', choices=tuple(CASES), default=None)
+    run.add_argument('--repeats', type=int, default=5)
+    run.add_argument('--backend', choices=('CPU', 'GPU'), default='CPU')
+    run.add_argument('--output', default='benchmark.json')
+
+    matrix = commands.add_parser('matrix', help="measure each configuration in a separate process")
+    matrix.add_argument('--cases', nargs='+', choices=tuple(CASES), default=tuple(CASES))
+    matrix.add_argument('--repeats', type=int, default=5)
+    matrix.add_argument('--backends', nargs='+', choices=('CPU', 'GPU'), default=('CPU',))
+    matrix.add_argument('--parallel', nargs='+', type=_parallel_mode, default=(None,),
+                        help=f"values of NUMBA_PARALLEL (any of: {' '.join(map(str, PARALLEL_MODES))})")
+    matrix.add_argument('--threads', nargs='+', type=int, default=(None,))
+    matrix.add_argument('--timeout', type=float, default=None)
+    matrix.add_argument('--output', default='benchmark.json')
+
+    scale = commands.add_parser('scaling', help="strong and weak thread scaling with per-dynamic efficiency")
+    scale.add_argument('--cases', nargs='+', choices=tuple(CASES), default=SCALING_CASES)
+    scale.add_argument('--threads', nargs='+', type=int, default=None)
+    scale.add_argument('--repeats', type=int, default=3)
+    scale.add_argument('--output', default='scaling.json')
+
+    cmp = commands.add_parser('compare', help="flag regressions of the current results against the baseline")
+    cmp.add_argument('baseline')
+    cmp.add_argument('current')
+    cmp.add_argument('--threshold', type=float, default=.1)
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        save(run_suite(args.cases, backend=GPU if args.backend == 'GPU' else CPU, repeats=args.repeats),
+             args.output)
+        return 0
+    if args.command == 'matrix':
+        configs = configurations(args.cases, backends=args.backends, parallel_modes=args.parallel,
+                                 thread_counts=args.threads, repeats=args.repeats)
+        data = run_matrix(configs, timeout=args.timeout)
+        save(data, args.output)
+        return 1 if data['errors'] else 0
+    if args.command == 'scaling':
+        data = {'metadata': metadata(CPU), 'results': []}
+        for case in args.cases:
+            for weak in (False, True):
+                results = scaling(case, thread_counts=args.threads, weak=weak, repeats=args.repeats)
+                print(f"{case} ({'weak' if weak else 'strong'} scaling, parallel efficiency):")
+                print(scaling_table(results))
+                data['results'] += results
+        save(data, args.output)
+        return 0
+
+    regressions = compare(load(args.baseline), load(args.current), threshold=args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression['case']} (size={regression['size']}, {regression['configuration']}): "
+              f"{regression['baseline']:.3f}s -> {regression['current']:.3f}s (x{regression['ratio']:.2f})")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Created at 18.10.2026
+"""
+
+import copy
+from PySDM.backends import CPU
+from PySDM.builder import Builder
+from PySDM.environments import Box
+from PySDM.dynamics import Coalescence
+from PySDM.initialisation.spectral_sampling import ConstantMultiplicity
+from PySDM_examples.Shima_et_al_2009.settings import Settings as BoxSettings
+from PySDM_examples.Arabas_and_Shima_2017.settings import setups as parcel_setups
+from PySDM_examples.Arabas_and_Shima_2017.simulation import Simulation as ParcelSimulation
+from PySDM_examples.Shipway_and_Hill_2012.settings import Settings as ColumnSettings
+from PySDM_examples.Shipway_and_Hill_2012.simulation import Simulation as ColumnSimulation
+from PySDM_examples.Arabas_et_al_2015.settings import Settings as KinematicSettings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation as KinematicSimulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM_examples.Arabas_et_al_2015.dummy_controller import DummyController
+
+
+class Case:
+    """ benchmarked configuration: `build(size, n_steps, backend)` constructs a fresh simulation and
+        returns a callable advancing it by `n_steps` timesteps along with its total number of
+        super-droplets and its `Core` (the meaning of `size` is case-specific and given by `size_name`) """
+
+    def __init__(self, name: str, build, sizes: tuple, size_name: str, n_steps: int):
+        self.name = name
+        self.build = build
+        self.sizes = sizes
+        self.size_name = size_name
+        self.n_steps = n_steps
+
+    def __call__(self, size, backend=CPU):
+        return self.build(size, self.n_steps, backend)
+
+
+def _box_coalescence(n_sd, n_steps, backend):
+    settings = BoxSettings()
+    builder = Builder(n_sd=n_sd, backend=backend)
+    builder.set_environment(Box(dv=settings.dv, dt=settings.dt))
+    attributes = {}
+    attributes['volume'], attributes['n'] = ConstantMultiplicity(settings.spectrum).sample(n_sd)
+    builder.add_dynamic(Coalescence(settings.kernel))
+    core = builder.build(attributes, products=[])
+    return lambda: core.run(n_steps), n_sd, core
+
+
+def _parcel_condensation(n_output, n_steps, backend):
+    settings = copy.copy(parcel_setups[0])
+    settings.n_output = n_output
+    simulation = ParcelSimulation(settings, backend)
+    return lambda: simulation.core.run(n_steps * simulation.n_substeps), 1, simulation.core
+
+
+def _shipway_column(n_sd_per_gridbox, n_steps, backend):
+    settings = ColumnSettings(n_sd_per_gridbox=n_sd_per_gridbox)
+    simulation = ColumnSimulation(settings, backend)
+    return lambda: simulation.run(nt=n_steps), settings.n_sd, simulation.core
+
+
+def _kinematic_2d(n_sd_per_gridbox, n_steps, backend):
+    settings = KinematicSettings()
+    settings.n_sd_per_gridbox = n_sd_per_gridbox
+    settings.simulation_time = n_steps * settings.dt
+    settings.output_interval = n_steps * settings.dt
+    settings.spin_up_time = 0
+    simulation = KinematicSimulation(settings, Storage(), backend)
+    simulation.reinit()
+    return lambda: simulation.run(DummyController(verbose=False)), settings.n_sd, simulation.core
+
+
+CASES = {case.name: case for case in (
+    Case('box_coalescence', _box_coalescence, sizes=(2 ** 13, 2 ** 15, 2 ** 17), size_name='n_sd', n_steps=100),
+    Case('parcel_condensation', _parcel_condensation, sizes=(100, 500), size_name='n_output', n_steps=50),
+    Case('shipway_column', _shipway_column, sizes=(32, 128), size_name='n_sd_per_gridbox', n_steps=30),
+    Case('kinematic_2d', _kinematic_2d, sizes=(32, 128), size_name='n_sd_per_gridbox', n_steps=10),
+)}
@@ -0,0 +1,85 @@
+"""
+Created at 18.10.2026
+"""
+
+import os
+import sys
+import json
+import itertools
+import subprocess
+
+_MARKER = 'BENCHMARK_RESULT '
+_BOOTSTRAP = '\n'.join((  # imports nothing from PySDM (nor `PySDM_examples.benchmarks`) before the JIT flags are set
+    "import sys, json",
+    "from PySDM_examples.utils.numba_conf import preset_jit_flags",
+    "configuration = json.loads(sys.argv[1])",
+    "if configuration.get('parallel') is not None:",
+    "    preset_jit_flags(parallel=configuration['parallel'])",
+    f"from {__name__} import _worker",
+    "_worker(configuration)"
+))
+
+
+def configurations(cases, sizes: dict = None, backends=('CPU',), parallel_modes=(None,), thread_counts=(None,),
+                   repeats: int = 5) -> list:
+    """ all combinations of the given settings as dicts accepted by `run_isolated()`;
+        `sizes` (keyed by case names) default to the case's sizes, `None` mode/threads to defaults """
+    from .cases import CASES
+    result = []
+    for case in cases:
+        for size, backend, parallel, threads in itertools.product(
+            (sizes or {}).get(case, CASES[case].sizes), backends, parallel_modes, thread_counts
+        ):
+            result.append({'case': case, 'size': size, 'backend': backend, 'parallel': parallel,
+                           'threads': threads, 'repeats': repeats})
+    return result
+
+
+def run_isolated(configuration: dict, timeout: float = None, python: str = sys.executable) -> dict:
+    """ measures (with `suite.measure()`) one configuration in a fresh Python process, so that
+        the numba threading setup and the compiled kernels of one configuration cannot affect
+        the others (the thread count is set through `NUMBA_NUM_THREADS`, the parallel mode
+        with `utils.numba_conf.preset_jit_flags()` before PySDM gets imported); the result
+        is passed back as JSON over the stdout pipe """
+    env = dict(os.environ)
+    if configuration.get('threads') is not None:
+        env['NUMBA_NUM_THREADS'] = str(configuration['threads'])
+    try:
+        process = subprocess.run(
+            [python, '-c', _BOOTSTRAP, json.dumps(configuration)],
+            env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return {'configuration': configuration, 'error': f"timed out after {timeout}s"}
+    for line in reversed(process.stdout.splitlines()):
+        if line.startswith(_MARKER):
+            return json.loads(line[len(_MARKER):])
+    return {'configuration': configuration, 'error': process.stderr[-2000:], 'returncode': process.returncode}
+
+
+def run_matrix(configs: list, timeout: float = None, report=print) -> dict:
+    """ `run_isolated()` for each of the configurations, returns data in the format of `suite.run_suite()`
+        (with each result carrying its `configuration` and the metadata of the process it ran in) """
+    results = []
+    for configuration in configs:
+        result = run_isolated(configuration, timeout)
+        if report is not None:
+            label = ', '.join(f"{k}={v}" for k, v in configuration.items() if k != 'repeats')
+            report(f"{label}: " + (f"error ({result['error'].strip().splitlines()[-1:]})" if 'error' in result
+                                   else f"{result['mean']:.3f}s"))
+        results.append(result)
+    metadata = next((result['metadata'] for result in results if 'metadata' in result), {})
+    return {'metadata': metadata, 'results': [result for result in results if 'error' not in result],
+            'errors': [result for result in results if 'error' in result]}
+
+
+def _worker(configuration: dict):
+    from PySDM import backends
+    from .cases import CASES
+    from .suite import measure, metadata
+
+    backend = getattr(backends, configuration.get('backend', 'CPU'))
+    result = measure(CASES[configuration['case']], configuration['size'], backend, configuration.get('repeats', 5))
+    result['configuration'] = configuration
+    result['metadata'] = metadata(backend)
+    print(_MARKER + json.dumps(result), flush=True)
@@ -0,0 +1,78 @@
+"""
+Created at 18.10.2026
+"""
+
+import time
+import numba
+import numpy as np
+from PySDM.backends import CPU
+from PySDM_examples.utils.dynamic_timers import DynamicTimes
+from .cases import CASES
+
+SCALING_CASES = ('box_coalescence', 'kinematic_2d')
+
+
+def default_thread_counts() -> tuple:
+    """ powers of two up to (and including) the number of threads numba was started with """
+    counts = [1]
+    while counts[-1] * 2 <= numba.config.NUMBA_NUM_THREADS:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != numba.config.NUMBA_NUM_THREADS:
+        counts.append(numba.config.NUMBA_NUM_THREADS)
+    return tuple(counts)
+
+
+def _timed_run(case, size, backend) -> dict:
+    run, n_sd, core = case(size, backend)
+    dynamic_times = DynamicTimes(core)
+    t0 = time.perf_counter()
+    run()
+    timings = {'total': time.perf_counter() - t0}
+    timings.update(dynamic_times.time)
+    return timings
+
+
+def scaling(case_name: str, size: int = None, thread_counts=None, weak: bool = False, repeats: int = 3,
+            backend=CPU) -> list:
+    """ wall times (median over `repeats`, after a warm-up run for each thread count), in total
+        and per dynamic, of the given case run with each of `thread_counts` numba threads, with
+        `size` fixed (strong scaling) or multiplied by the thread count (`weak` scaling); parallel
+        efficiency is `T_1 / (p T_p)` for strong and `T_1 / T_p` for weak scaling, relative to
+        the first of `thread_counts` (`p` being the ratio of the thread counts) """
+    case = CASES[case_name]
+    size = size or case.sizes[-1]
+    thread_counts = thread_counts or default_thread_counts()
+    initial_threads = numba.get_num_threads()
+    results = []
+    try:
+        for threads in thread_counts:
+            numba.set_num_threads(threads)
+            threads_size = size * threads // thread_counts[0] if weak else size
+            _timed_run(case, threads_size, backend)
+            samples = [_timed_run(case, threads_size, backend) for _ in range(repeats)]
+            times = {name: float(np.median([sample[name] for sample in samples])) for name in samples[0]}
+            results.append({'case': case_name, 'mode': 'weak' if weak else 'strong', 'threads': threads,
+                            'size_name': case.size_name, 'size': threads_size, 'time': times})
+    finally:
+        numba.set_num_threads(initial_threads)
+
+    reference = results[0]
+    for result in results:
+        p = result['threads'] / reference['threads']
+        result['efficiency'] = {
+            name: (reference['time'][name] / t / (1 if weak else p)) if t > 0 else None
+            for name, t in result['time'].items()
+        }
+    return results
+
+
+def scaling_table(results: list) -> str:
+    """ parallel efficiency per thread count (rows) and dynamic (columns) """
+    names = list(results[0]['efficiency'].keys())
+    lines = [f"{'threads':>8} {'time [s]':>10}" + ''.join(f" {name[:20]:>20}" for name in names)]
+    for result in results:
+        lines.append(f"{result['threads']:>8} {result['time']['total']:>10.3f}" + ''.join(
+            f" {'-' if result['efficiency'][name] is None else format(result['efficiency'][name], '.2f'):>20}"
+            for name in names
+        ))
+    return '\n'.join(lines)
@@ -0,0 +1,125 @@
+"""
+Created at 18.10.2026
+"""
+
+import json
+import time
+import platform
+import datetime
+import numba
+import numpy as np
+from scipy import stats
+from PySDM.backends import CPU
+from PySDM.backends.numba import conf
+from PySDM_examples.utils.result_cache import package_versions
+from .cases import CASES
+
+
+def confidence_interval(samples, confidence: float = .95) -> tuple:
+    """ Student-t confidence interval of the mean of `samples` """
+    samples = np.asarray(samples, dtype=float)
+    mean = np.mean(samples)
+    if len(samples) < 2:
+        return mean, mean
+    half_width = stats.t.ppf((1 + confidence) / 2, len(samples) - 1) * stats.sem(samples)
+    return mean - half_width, mean + half_width
+
+
+def measure(case, size, backend=CPU, repeats: int = 5) -> dict:
+    """ times `repeats` runs of `case` for `size`, each on a freshly built simulation, after
+        a warm-up one (whose excess time over the median of the subsequent ones is reported as
+        the compilation time) """
+    if repeats < 1:
+        raise ValueError(f"repeats must be at least 1 (got {repeats})")
+    setup_times, run_times = [], []
+    for _ in range(repeats + 1):
+        t0 = time.perf_counter()
+        run, n_sd, _ = case(size, backend)
+        t1 = time.perf_counter()
+        run()
+        t2 = time.perf_counter()
+        setup_times.append(t1 - t0)
+        run_times.append(t2 - t1)
+    (first_setup_time, *setup_times), (first_run_time, *run_times) = setup_times, run_times
+
+    mean = float(np.mean(run_times))
+    return {
+        'case': case.name,
+        'size_name': case.size_name,
+        'size': size,
+        'n_sd': n_sd,
+        'n_steps': case.n_steps,
+        'repeats': repeats,
+        'compile_time': max(0., first_setup_time + first_run_time
+                            - float(np.median(setup_times)) - float(np.median(run_times))),
+        'setup_time': setup_times,
+        'run_time': run_times,
+        'mean': mean,
+        'std': float(np.std(run_times, ddof=1)) if repeats > 1 else 0.,
+        'ci95': [float(bound) for bound in confidence_interval(run_times)],
+        'sd_steps_per_second': n_sd * case.n_steps / mean
+    }
+
+
+def metadata(backend=CPU) -> dict:
+    return {
+        'versions': package_versions(),
+        'backend': getattr(backend, '__name__', str(backend)),
+        'numba_threads': numba.get_num_threads(),
+        'parallel': conf.NUMBA_PARALLEL,
+        'jit_parallel': conf.JIT_FLAGS['parallel'],
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'python': platform.python_version(),
+        'timestamp': datetime.datetime.now().isoformat()
+    }
+
+
+def run_suite(cases=None, sizes: dict = None, backend=CPU, repeats: int = 5, report=print) -> dict:
+    """ measures the given cases (names, all of `CASES` by default) for their default sizes
+        or those given in `sizes` (dict keyed by case names); returns a JSON-serialisable dict """
+    results = []
+    for name in cases or CASES:
+        case = CASES[name]
+        for size in (sizes or {}).get(name, case.sizes):
+            result = measure(case, size, backend, repeats)
+            if report is not None:
+                low, high = result['ci95']
+                report(f"{name} ({case.size_name}={size}): {result['mean']:.3f}s [{low:.3f}, {high:.3f}]"
+                       f" + {result['compile_time']:.1f}s compilation")
+            results.append(result)
+    return {'metadata': metadata(backend), 'results': results}
+
+
+def save(data: dict, path: str):
+    with open(path, 'w') as file:
+        json.dump(data, file, indent=1)
+
+
+def load(path: str) -> dict:
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+def _key(result):
+    configuration = {k: v for k, v in result.get('configuration', {}).items() if k != 'repeats'}
+    return result['case'], result['size'], json.dumps(configuration, sort_keys=True)
+
+
+def compare(baseline: dict, current: dict, threshold: float = .1) -> list:
+    """ entries (for cases, sizes and, if any, isolated-run configurations present in both) whose
+        mean run time grew by more than `threshold` (relative) with the confidence intervals
+        not overlapping """
+    reference = {_key(result): result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        key = _key(result)
+        if key not in reference:
+            continue
+        base = reference[key]
+        ratio = result['mean'] / base['mean']
+        if ratio > 1 + threshold and result['ci95'][0] > base['ci95'][1]:
+            regressions.append({'case': result['case'], 'size': result['size'],
+                                'configuration': result.get('configuration'), 'baseline': base['mean'],
+                                'current': result['mean'], 'ratio': ratio})
+    return regressions
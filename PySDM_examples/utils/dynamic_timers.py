@@ -0,0 +1,31 @@
+"""
+Created at 18.10.2026
+"""
+
+
+class DynamicTimes:
+    """ wall time spent in each dynamic of a `core` (and number of steps), accumulated from the
+        per-dynamic timers the core keeps for PySDM's `DynamicWallTime` products (read, as an
+        observer, after each step - so both report the same measurements) """
+
+    def __init__(self, core):
+        self.core = core
+        self.time = {name: 0. for name in core.dynamics}
+        self.steps = 0
+        core.observers.append(self)
+
+    def notify(self):
+        for name in self.time:
+            self.time[name] += self.core.timers[name].time
+        self.steps += 1
+
+
+def summary_table(times: dict, calls: dict, total_time: float) -> str:
+    """ per-dynamic wall time (total, per call and as a fraction of `total_time`) """
+    lines = [f"{'dynamic':>24} {'total [s]':>10} {'per call [ms]':>14} {'share':>7}"]
+    for name, time_ in sorted(times.items(), key=lambda item: -item[1]):
+        per_call = 1000 * time_ / calls[name] if calls[name] else float('nan')
+        share = time_ / total_time if total_time > 0 else float('nan')
+        lines.append(f"{name:>24} {time_:>10.3f} {per_call:>14.3f} {share:>7.1%}")
+    lines.append(f"{'(all, incl. output)':>24} {total_time:>10.3f}")
+    return '\n'.join(lines)
@@ -0,0 +1,109 @@
+"""
+Created at 18.10.2026
+"""
+
+import copy
+import numpy as np
+
+
+class _Accumulator:
+    def __init__(self, data):
+        data = np.asarray(data, dtype=np.float64)
+        self.count = 1
+        self.mean = np.copy(data)
+        self.m2 = np.zeros_like(self.mean)
+        self.min = np.copy(data)
+        self.max = np.copy(data)
+
+    def update(self, data):
+        """ Welford's online update """
+        data = np.asarray(data, dtype=np.float64)
+        self.count += 1
+        delta = data - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (data - self.mean)
+        np.minimum(self.min, data, out=self.min)
+        np.maximum(self.max, data, out=self.max)
+
+    def merge(self, other):
+        """ Chan et al.'s pairwise combination of two partial aggregates """
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+
+
+class EnsembleStatistics:
+    """ online ensemble mean, variance, minimum and maximum of each product at each output step:
+        members are fed one value at a time (e.g. as a `Simulation` sink, through `save()`)
+        so that memory does not depend on the ensemble size """
+
+    def __init__(self):
+        self.accumulators = {}
+        self.settings = None
+
+    def init(self, settings):
+        """ storage-sink interface: called for each member, keeps the statistics gathered so far """
+        self.settings = settings
+
+    def save(self, data: (float, np.ndarray), step: int, name: str):
+        key = (name, step)
+        if key in self.accumulators:
+            self.accumulators[key].update(data)
+        else:
+            self.accumulators[key] = _Accumulator(data)
+
+    def commit(self, step: int):
+        pass
+
+    def flush(self):
+        pass
+
+    def merge(self, other: 'EnsembleStatistics'):
+        """ adds the statistics of a disjoint set of members (e.g. gathered in another process) """
+        for key, accumulator in other.accumulators.items():
+            if key in self.accumulators:
+                self.accumulators[key].merge(accumulator)
+            else:
+                self.accumulators[key] = copy.deepcopy(accumulator)
+
+    def names(self) -> set:
+        return {name for name, _ in self.accumulators}
+
+    def steps(self, name: str) -> list:
+        return sorted(step for key_name, step in self.accumulators if key_name == name)
+
+    def count(self, name: str, step: int) -> int:
+        return self.accumulators[(name, step)].count
+
+    def mean(self, name: str, step: int) -> np.ndarray:
+        return self.accumulators[(name, step)].mean
+
+    def variance(self, name: str, step: int, ddof: int = 1) -> np.ndarray:
+        accumulator = self.accumulators[(name, step)]
+        if accumulator.count <= ddof:
+            return np.full_like(accumulator.m2, np.nan)
+        return accumulator.m2 / (accumulator.count - ddof)
+
+    def std(self, name: str, step: int, ddof: int = 1) -> np.ndarray:
+        return np.sqrt(self.variance(name, step, ddof))
+
+    def min(self, name: str, step: int) -> np.ndarray:
+        return self.accumulators[(name, step)].min
+
+    def max(self, name: str, step: int) -> np.ndarray:
+        return self.accumulators[(name, step)].max
+
+    def write(self, path: str):
+        """ saves only the summary statistics (as `<name>/<step>/<statistic>` arrays of an `.npz` file) """
+        arrays = {}
+        for (name, step), accumulator in self.accumulators.items():
+            arrays[f"{name}/{step}/count"] = np.asarray(accumulator.count)
+            arrays[f"{name}/{step}/mean"] = accumulator.mean
+            arrays[f"{name}/{step}/variance"] = self.variance(name, step)
+            arrays[f"{name}/{step}/min"] = accumulator.min
+            arrays[f"{name}/{step}/max"] = accumulator.max
+        np.savez_compressed(path, **arrays)
@@ -0,0 +1,73 @@
+"""
+Created at 18.10.2026
+"""
+
+import os
+import sys
+import numba
+from numba.core import config
+from numba.core.caching import NullCache
+from numba.core.dispatcher import Dispatcher
+from PyMPDATA import Options, Stepper
+
+_steppers = {}
+
+
+def enable_jit_cache(cache_dir: str = None, include_pysdm: bool = False) -> int:
+    """ turns on numba's on-disk caching (in `cache_dir`, if given, otherwise next to the sources)
+        for the already imported numba kernels of the examples and, only with `include_pysdm=True`,
+        of PySDM (backend, dynamics, ...); returns the number of kernels for which caching was enabled
+        (kernels compiled from closures, e.g. the PyMPDATA steppers, cannot be cached on disk -
+        see `cached_stepper` for those)
+
+        `include_pysdm` is opt-in as PySDM compiles its kernels with `cache=False` on purpose:
+        numba validates a cache entry against the source file of the kernel only (numba issue #6131),
+        so entries go stale, without any error, when a function the kernel calls, a formula or
+        a `JIT_FLAGS` value changes - the cache directory has to be cleared after any such change
+        (e.g. a PySDM upgrade); `cache_dir` is applied to the kernels enabled here only, i.e.
+        `NUMBA_CACHE_DIR` is restored afterwards for the rest of the process """
+    packages = ('PySDM.', 'PySDM_examples.') if include_pysdm else ('PySDM_examples.',)
+    previous = os.environ.get('NUMBA_CACHE_DIR')
+    if cache_dir is not None:
+        os.environ['NUMBA_CACHE_DIR'] = str(cache_dir)
+        config.reload_config()
+    try:
+        count = 0
+        for name, module in tuple(sys.modules.items()):
+            if module is None or not name.startswith(packages):
+                continue
+            for dispatcher in _dispatchers(vars(module).values()):
+                if dispatcher.py_func.__closure__ is None and isinstance(dispatcher._cache, NullCache):
+                    dispatcher.enable_caching()
+                    count += 1
+    finally:
+        if cache_dir is not None:
+            if previous is None:
+                del os.environ['NUMBA_CACHE_DIR']
+            else:
+                os.environ['NUMBA_CACHE_DIR'] = previous
+            config.reload_config()
+    return count
+
+
+def _dispatchers(values):
+    for value in values:
+        if isinstance(value, type):
+            yield from _dispatchers(
+                item.__func__ if isinstance(item, staticmethod) else item
+                for item in vars(value).values()
+            )
+        elif isinstance(value, Dispatcher):
+            yield value
+
+
+def cached_stepper(options: dict, grid: tuple, non_unit_g_factor: bool = False, n_threads: int = None):
+    """ returns PyMPDATA `Options` and `Stepper` for the given arguments reusing, within a process,
+        steppers compiled for earlier solvers (the compilation takes seconds, the reuse nothing) """
+    key = (tuple(sorted(options.items())), tuple(grid), non_unit_g_factor,
+           n_threads or numba.get_num_threads())
+    if key not in _steppers:
+        opts = Options(**options)
+        kwargs = {} if n_threads is None else {'n_threads': n_threads}
+        _steppers[key] = opts, Stepper(options=opts, grid=tuple(grid), non_unit_g_factor=non_unit_g_factor, **kwargs)
+    return _steppers[key]
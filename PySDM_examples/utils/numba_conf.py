@@ -0,0 +1,62 @@
+"""
+Created at 18.10.2026
+"""
+
+import sys
+import importlib.abc
+import importlib.machinery
+
+_CONF = 'PySDM.backends.numba.conf'
+PARALLEL_MODES = (False, 'sync', 'async')
+
+
+def parallel_mode(value):
+    """ one of `PARALLEL_MODES` (values of PySDM's `conf.NUMBA_PARALLEL`) given as such or by name,
+        as in `--parallel False sync async`; raises `ValueError` for anything else """
+    for mode in PARALLEL_MODES:
+        if value is mode or value == str(mode):
+            return mode
+    raise ValueError(f"unknown parallel mode {value!r} (expected one of {', '.join(map(str, PARALLEL_MODES))})")
+
+
+class _Loader(importlib.abc.Loader):
+    def __init__(self, loader, flags):
+        self.loader = loader
+        self.flags = flags
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        flags = dict(self.flags)
+        if 'parallel' in flags:
+            module.NUMBA_PARALLEL = flags['parallel']
+            flags['parallel'] = flags['parallel'] is not False
+        module.JIT_FLAGS.update(flags)
+
+
+class _Finder(importlib.abc.MetaPathFinder):
+    def __init__(self, flags):
+        self.flags = flags
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != _CONF:
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        spec.loader = _Loader(spec.loader, self.flags)
+        return spec
+
+
+def preset_jit_flags(**flags):
+    """ overrides entries of PySDM's numba `conf.JIT_FLAGS` right as the `conf` module gets first
+        imported, i.e. before any PySDM kernel is defined with them - except for `parallel`, which
+        takes one of `PARALLEL_MODES`, sets `conf.NUMBA_PARALLEL` to it and `JIT_FLAGS['parallel']`
+        to whether it is parallel at all; has to be called before PySDM is imported
+        (e.g. first thing in a fresh process) """
+    if _CONF in sys.modules:
+        raise RuntimeError("PySDM already imported - JIT flags can only be preset in a fresh process")
+    if 'parallel' in flags:
+        flags['parallel'] = parallel_mode(flags['parallel'])
+    sys.meta_path.insert(0, _Finder(flags))
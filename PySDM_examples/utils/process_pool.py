@@ -0,0 +1,19 @@
+"""
+Created at 18.10.2026
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _init_worker(numba_threads):
+    # before numba gets imported in the (spawned) worker process
+    os.environ['NUMBA_NUM_THREADS'] = str(numba_threads)
+
+
+def spawned_pool(max_workers: int, numba_threads: int = 1) -> ProcessPoolExecutor:
+    """ pool of spawned (not forked - numba's threading layer does not survive a fork) processes,
+        each limited to `numba_threads` numba threads """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=_init_worker, initargs=(numba_threads,))
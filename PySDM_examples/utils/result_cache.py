@@ -0,0 +1,279 @@
+"""
+Created at 18.10.2026
+"""
+
+import os
+import json
+import time
+import uuid
+import pickle
+import hashlib
+import inspect
+import functools
+import importlib
+import contextlib
+from pathlib import Path
+import numpy as np
+
+_MAX_DEPTH = 8
+_LOCK_TIMEOUT = 60
+_KEY_PACKAGES = ('PySDM', 'numba', 'numpy', 'scipy')
+
+
+def package_versions() -> str:
+    """ same format as `Settings.versions` of `Arabas_et_al_2015` (for settings classes lacking it) """
+    versions = {}
+    for name in _KEY_PACKAGES:
+        try:
+            versions[name] = getattr(importlib.import_module(name), '__version__', None)
+        except ImportError:
+            versions[name] = None
+    return str(versions)
+
+
+def _qualname(value) -> str:
+    return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__qualname__)}"
+
+
+def _code(code) -> str:
+    """ digest of the bytecode, constants (including nested functions) and names used by `code` """
+    consts = tuple(_code(const) if inspect.iscode(const) else repr(const) for const in code.co_consts)
+    return hashlib.sha1(repr((code.co_code, consts, code.co_names)).encode()).hexdigest()
+
+
+def _cells(function) -> tuple:
+    result = []
+    for cell in function.__closure__ or ():
+        try:
+            result.append(cell.cell_contents)
+        except ValueError:  # empty cell
+            result.append(None)
+    return tuple(result)
+
+
+def _callable(value, depth, seen):
+    """ functions (incl. lambdas, closures and JIT dispatchers) by their code, defaults and captured
+        values; bound methods also by the object they are bound to; classes and builtins by name """
+    if isinstance(value, functools.partial):
+        return ('partial', _callable(value.func, depth, seen),
+                _canonical(value.args, depth, seen), _canonical(value.keywords, depth, seen))
+    function = getattr(value, 'py_func', value)
+    if inspect.ismethod(function):
+        return 'method', _canonical(function.__self__, depth, seen), _callable(function.__func__, depth, seen)
+    if inspect.isfunction(function):
+        return ('function', _qualname(function), _code(function.__code__),
+                _canonical(function.__defaults__, depth, seen), _canonical(function.__kwdefaults__, depth, seen),
+                _canonical(_cells(function), depth + 1, seen))
+    return 'callable', _qualname(value)
+
+
+def _canonical(value, depth=0, seen=None):
+    """ picklable representation of `value` independent of object identities and dict ordering;
+        raises `ValueError` for values whose content cannot be represented (so that different
+        values never share a key) """
+    seen = seen or frozenset()
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha1(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return 'ndarray', str(value.dtype), value.shape, digest
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_canonical(item, depth, seen) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return 'set', tuple(sorted(repr(_canonical(item, depth, seen)) for item in value))
+    if isinstance(value, dict):
+        return 'dict', tuple(sorted((repr(k), _canonical(v, depth, seen)) for k, v in value.items()))
+    if inspect.ismodule(value):
+        return 'module', value.__name__
+    if id(value) in seen:
+        return 'cycle', _qualname(type(value))
+    if isinstance(value, type) or inspect.isroutine(value) or isinstance(value, functools.partial) \
+            or hasattr(value, 'py_func'):
+        return _callable(value, depth, seen | {id(value)})
+    if depth >= _MAX_DEPTH:
+        raise ValueError(f"{_qualname(type(value))} nested deeper than {_MAX_DEPTH} objects - cannot be cached")
+    if hasattr(value, '__dict__'):
+        return 'object', _qualname(type(value)), _canonical(vars(value), depth + 1, seen | {id(value)})
+    try:
+        return 'pickled', _qualname(type(value)), hashlib.sha1(pickle.dumps(value)).hexdigest()
+    except Exception as e:
+        raise ValueError(f"{_qualname(type(value))} cannot be cached: {e}") from e
+
+
+def parameters(settings) -> dict:
+    """ JSON-serialisable summary of the settings used for querying the cache: scalar attributes
+        as they are, other ones by their type """
+    result = {}
+    for name, value in sorted(vars(settings).items()):
+        if isinstance(value, np.generic):
+            value = value.item()
+        if value is None or isinstance(value, (bool, int, float, str)):
+            result[name] = value
+        elif isinstance(value, type) or inspect.isroutine(value):
+            result[name] = value.__qualname__
+        else:
+            result[name] = type(value).__qualname__
+    return result
+
+
+def result_key(label: str, settings, arguments: dict = None) -> str:
+    """ stable hash of the settings (including the package versions - `settings.versions` if present),
+        of other `arguments` and of the `label` identifying what was run with them """
+    versions = getattr(settings, 'versions', None) or package_versions()
+    values = (label, versions, _canonical(settings), _canonical(arguments or {}))
+    return hashlib.sha1(repr(values).encode()).hexdigest()
+
+
+class ResultCache:
+    """ on-disk memoization of example runs: results pickled as `<path>/<key>.pkl` with an index
+        (`<path>/index.json`) of their labels, parameters, sizes and last-use times; once `max_bytes`
+        or `max_entries` is exceeded, the least recently used results are evicted; the index is
+        updated under a lock file (`<path>/index.lock`) so that processes sharing the cache
+        directory do not lose each other's entries """
+
+    def __init__(self, path, max_bytes: int = None, max_entries: int = None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _index_path(self):
+        return self.path / 'index.json'
+
+    def _filepath(self, key):
+        return self.path / f"{key}.pkl"
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self._index_path(), 'r') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write_index(self, index: dict):
+        tmp_path = f"{self._index_path()}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(index, file)
+        os.replace(tmp_path, self._index_path())
+
+    @contextlib.contextmanager
+    def _locked_index(self):
+        """ read-modify-write of the index: yields it and writes it back, all while holding
+            the lock file (created exclusively; taken over once older than `_LOCK_TIMEOUT` seconds,
+            i.e. left behind by a process which died holding it) """
+        lock_path = self.path / 'index.lock'
+        while True:
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock_path) > _LOCK_TIMEOUT:
+                        os.remove(lock_path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                time.sleep(.01)
+        try:
+            index = self._read_index()
+            yield index
+            self._write_index(index)
+        finally:
+            os.remove(lock_path)
+
+    def __len__(self):
+        return len(self._read_index())
+
+    def __contains__(self, key: str):
+        return key in self._read_index() and os.path.exists(self._filepath(key))
+
+    def get(self, key: str, default=None):
+        if key not in self._read_index():
+            return default
+        try:
+            with open(self._filepath(key), 'rb') as file:
+                result = pickle.load(file)
+        except FileNotFoundError:
+            with self._locked_index() as index:
+                index.pop(key, None)
+            return default
+        with self._locked_index() as index:
+            if key in index:
+                index[key]['last_used'] = time.time()
+        return result
+
+    def put(self, key: str, result, label: str = None, settings=None):
+        tmp_path = f"{self._filepath(key)}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'wb') as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._filepath(key))
+
+        with self._locked_index() as index:
+            now = time.time()
+            index[key] = {
+                'label': label,
+                'parameters': parameters(settings) if settings is not None else {},
+                'size': os.path.getsize(self._filepath(key)),
+                'created': now,
+                'last_used': now
+            }
+            self._evict(index, keep=key)
+
+    def _evict(self, index: dict, keep: str):
+        by_age = sorted((key for key in index if key != keep), key=lambda key: index[key]['last_used'])
+        while by_age and (
+            (self.max_entries is not None and len(index) > self.max_entries) or
+            (self.max_bytes is not None and sum(entry['size'] for entry in index.values()) > self.max_bytes)
+        ):
+            key = by_age.pop(0)
+            del index[key]
+            if os.path.exists(self._filepath(key)):
+                os.remove(self._filepath(key))
+
+    def entries(self, label: str = None, **criteria) -> dict:
+        """ index entries (keyed by result key) with the given `label` and parameter values,
+            e.g. `entries(n_sd=2**15, adaptive=True)` """
+        return {
+            key: entry for key, entry in self._read_index().items()
+            if (label is None or entry['label'] == label)
+            and all(entry['parameters'].get(name) == value for name, value in criteria.items())
+        }
+
+    def clear(self):
+        with self._locked_index() as index:
+            for key in index:
+                if os.path.exists(self._filepath(key)):
+                    os.remove(self._filepath(key))
+            index.clear()
+
+    def memoize(self, function, bypass=('observers',)):
+        """ wraps `function(settings, ...)` so that results for equal settings (and other arguments)
+            are loaded from the cache instead of being recomputed; arguments named in `bypass` are
+            not part of the key and, whenever any of them is given a non-empty value (e.g. observers,
+            which rely on the run actually taking place), the cache is not used at all """
+        signature = inspect.signature(function)
+        label = f"{function.__module__}.{function.__qualname__}"
+
+        @functools.wraps(function)
+        def wrapper(settings, *args, **kwargs):
+            bound = signature.bind(settings, *args, **kwargs)
+            if any(bound.arguments.get(name) for name in bypass):
+                return function(settings, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {name: value for name, value in bound.arguments.items() if name not in bypass}
+            arguments.pop(next(iter(signature.parameters)), None)
+            key = result_key(label, settings, arguments)
+            result = self.get(key, default=self)
+            if result is not self:
+                self.hits += 1
+                return result
+            self.misses += 1
+            result = function(settings, *args, **kwargs)
+            self.put(key, result, label=label, settings=settings)
+            return result
+
+        return wrapper
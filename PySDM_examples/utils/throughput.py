@@ -0,0 +1,104 @@
+"""
+Created at 18.10.2026
+"""
+
+import json
+import time
+from pathlib import Path
+
+
+class ThroughputMeter:
+    """ progress metrics computed at each controller update and (if `sink` is given - a path
+        appended to or an object with `write()`) emitted as JSON lines: steps per second and
+        super-droplet-steps per second (since the previous update and overall), output-step latency
+        (wall time between updates), ETA and the compute vs. storage time reported by the simulation
+        through `add()`; without the latter (e.g. for `NetCDFExporter.run()`), step-based metrics
+        are derived from the progress fraction and `n_steps` (if known) """
+
+    def __init__(self, sink=None, label: str = None):
+        self.sink = sink
+        self.label = label
+        self.pending = None, None
+        self.last = None
+        self.start()
+
+    def configure(self, n_sd: int = None, n_steps: int = None):
+        """ number of super-droplets and of steps still to be done in the next run - applied by
+            (and only by) the following `start()`, so that already its first record carries them """
+        self.pending = n_sd, n_steps
+
+    def start(self):
+        self.n_sd, self.n_steps = self.pending
+        self.pending = None, None
+        self.t0 = time.perf_counter()
+        self.t_last = self.t0
+        self.steps = 0
+        self.steps_last = 0
+        self.compute_time = 0.
+        self.storage_time = 0.
+        self.fed = False
+        self.fraction_first = None
+
+    def add(self, steps: int = 0, compute_time: float = 0., storage_time: float = 0.):
+        self.fed = True
+        self.steps += steps
+        self.compute_time += compute_time
+        self.storage_time += storage_time
+
+    def update(self, fraction: float) -> dict:
+        now = time.perf_counter()
+        if self.fraction_first is None:
+            self.fraction_first = fraction
+        if not self.fed and self.n_steps is not None:
+            self.steps = round((fraction - self.fraction_first) * self.n_steps)
+        elapsed = now - self.t0
+        interval = now - self.t_last
+        done = fraction - self.fraction_first
+
+        if self.fed and self.n_steps is not None:
+            eta = elapsed * (self.n_steps - self.steps) / self.steps if self.steps > 0 else None
+        else:
+            eta = elapsed * (1 - fraction) / done if done > 0 else None
+
+        record = {
+            'label': self.label,
+            'time': time.time(),
+            'fraction': fraction,
+            'elapsed': elapsed,
+            'output_latency': interval,
+            'eta': eta,
+            'steps': self.steps if self.fed or self.n_steps is not None else None,
+            'steps_per_second': None,
+            'steps_per_second_overall': None,
+            'sd_steps_per_second': None,
+            'compute_time': self.compute_time if self.fed else None,
+            'storage_time': self.storage_time if self.fed else None,
+            'storage_fraction': None
+        }
+        if record['steps'] is not None:
+            if interval > 0:
+                record['steps_per_second'] = (self.steps - self.steps_last) / interval
+            if elapsed > 0:
+                record['steps_per_second_overall'] = self.steps / elapsed
+            if self.n_sd is not None and record['steps_per_second'] is not None:
+                record['sd_steps_per_second'] = self.n_sd * record['steps_per_second']
+        if self.fed and self.compute_time + self.storage_time > 0:
+            record['storage_fraction'] = self.storage_time / (self.compute_time + self.storage_time)
+
+        self.t_last = now
+        self.steps_last = self.steps
+        self.last = record
+        self._emit(record)
+        return record
+
+    def _emit(self, record: dict):
+        if self.sink is None:
+            return
+        line = json.dumps(record) + '\n'
+        if isinstance(self.sink, (str, Path)):
+            with open(self.sink, 'a') as file:
+                file.write(line)
+        else:
+            self.sink.write(line)
+            if hasattr(self.sink, 'flush'):
+                self.sink.flush()
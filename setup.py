@@ -10,6 +10,7 @@ setup(
                       'matplotlib>=3.2.2',
                       'ipywidgets>=7.5.1',
                       'ghapi'],  # TODO #457
+    extras_require={'netcdf4': ['netCDF4']},
     author='https://github.com/orgs/atmos-cloud-sim-uj/people',
     license="GPL-3.0",
     packages=find_packages(include=['PySDM_examples', 'PySDM_examples.*'])
@@ -0,0 +1,24 @@
+from PySDM_examples.Arabas_and_Shima_2017.settings import setups
+from PySDM_examples.Arabas_and_Shima_2017.simulation import Simulation
+from PySDM_examples.Arabas_and_Shima_2017.sweep import run_setups
+import numpy as np
+import copy
+import pytest
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_sweep_matches_sequential_runs(max_workers):
+    # Arrange
+    sweep = [copy.copy(settings) for settings in setups[:3]]
+    for settings in sweep:
+        settings.n_output = 20
+    expected = [Simulation(settings).run() for settings in sweep]
+
+    # Act
+    outputs = run_setups(sweep, max_workers=max_workers)
+
+    # Assert
+    assert len(outputs) == len(sweep)
+    for output, reference in zip(outputs, expected):
+        for key in ('r', 'S', 'z', 't'):
+            np.testing.assert_allclose(output[key], reference[key])
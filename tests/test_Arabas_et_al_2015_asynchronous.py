@@ -0,0 +1,45 @@
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM_examples.Arabas_et_al_2015.thread_budget import threadsafe_layer
+from PySDM.backends import CPU
+import numpy as np
+import pytest
+
+
+@pytest.mark.skipif(not threadsafe_layer(), reason="neither tbb nor omp numba threading layer available")
+def test_asynchronous_advection_matches_synchronous():
+    # Arrange
+    settings = Settings()
+    settings.grid = (10, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 6 * settings.dt
+    settings.output_interval = 2 * settings.dt
+    settings.spin_up_time = 2 * settings.dt
+    settings.processes['coalescence'] = False  # stochastic
+
+    storages = {}
+    products = {}
+    for asynchronous in (False, True):
+        settings.mpdata_asynchronous = asynchronous
+        storages[asynchronous] = Storage()
+        simulation = Simulation(settings, storages[asynchronous], CPU)
+        np.random.seed(44)  # spatial sampling
+
+        # Act
+        simulation.reinit()
+        simulation.run()
+        products[asynchronous] = simulation.products
+
+    # Assert
+    assert 'advection_overlap' not in products[False]
+    for name, product in products[False].items():
+        if product.shape == ():
+            continue
+        for step in settings.output_steps:
+            np.testing.assert_allclose(
+                storages[True].load(name, step), storages[False].load(name, step), rtol=1e-6, atol=1e-12
+            )
+    overlap = storages[True].load('advection_overlap')
+    assert np.all((0 <= overlap) & (overlap <= 1))
+    assert storages[True].load('advection_time')[1:].sum() > 0
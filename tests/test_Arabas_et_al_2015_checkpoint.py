@@ -0,0 +1,70 @@
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM_examples.Arabas_et_al_2015.netcdf_exporter import NetCDFExporter
+from PySDM_examples.Arabas_et_al_2015.dummy_controller import DummyController
+from PySDM.backends import CPU
+from scipy.io.netcdf import netcdf_file
+import numpy as np
+import pytest
+
+
+class CrashingController(DummyController):
+    def __init__(self, crash_after):
+        super().__init__()
+        self.crash_after = crash_after
+
+    def set_percent(self, value):
+        if value >= self.crash_after:
+            raise KeyboardInterrupt()
+
+
+@pytest.mark.parametrize("memmap", (True, False))
+def test_resume_from_checkpoint(tmp_path, memmap):
+    # Arrange
+    settings = Settings()
+    settings.grid = (10, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 8 * settings.dt
+    settings.output_interval = settings.dt
+    settings.spin_up_time = 2 * settings.dt
+    settings.checkpoint_interval = 3 * settings.dt
+    settings.condensation_adaptive = False
+    settings.processes['coalescence'] = False  # stochastic
+
+    reference = Storage(memmap=memmap)
+    np.random.seed(44)  # spatial sampling
+    simulation = Simulation(settings, reference, CPU)
+    simulation.reinit()
+    simulation.run()
+
+    path = tmp_path / 'output'
+    np.random.seed(44)
+    interrupted = Simulation(settings, Storage(path=path, memmap=memmap), CPU)
+    interrupted.reinit()
+    with pytest.raises(KeyboardInterrupt):
+        interrupted.run(CrashingController(crash_after=5 / 8))
+    assert interrupted.checkpoint_count == 1
+    assert interrupted.checkpoint_time > 0
+    assert Storage.load_checkpoint(path)[0] == 3
+
+    storage = Storage(path=path, memmap=memmap)
+    filename = str(tmp_path / 'output.nc')
+    resumed = Simulation(settings, storage, CPU)
+    resumed.sinks.append(NetCDFExporter(storage, settings, resumed, filename))
+
+    # Act
+    resumed.resume(path)
+
+    # Assert
+    assert resumed.core.n_steps == settings.output_steps[-1]
+    np.testing.assert_array_equal(storage.load('wall_time').shape, (len(settings.output_steps),))
+    ncdf = netcdf_file(filename, mode='r', mmap=False)
+    for name, product in resumed.products.items():
+        if 'time' in name:
+            continue
+        for i, step in enumerate(settings.output_steps):
+            expected = reference.load(name)[i] if product.shape == () else reference.load(name, step)
+            actual = storage.load(name)[i] if product.shape == () else storage.load(name, step)
+            np.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-12)
+            np.testing.assert_allclose(ncdf.variables[name][i], expected, rtol=1e-6, atol=1e-12)
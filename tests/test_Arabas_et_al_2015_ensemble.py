@@ -0,0 +1,27 @@
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.ensemble import run_ensemble
+from scipy.io.netcdf import netcdf_file
+
+
+def test_ensemble_reports_failures_without_aborting(tmp_path):
+    # Arrange
+    members = []
+    for i, n_sd_per_gridbox in enumerate((2, 4, 2)):
+        settings = Settings()
+        settings.grid = (8, 6)
+        settings.n_sd_per_gridbox = n_sd_per_gridbox
+        settings.simulation_time = 2 * settings.dt
+        settings.output_interval = settings.dt
+        members.append({'settings': settings, 'file': str(tmp_path / f"{i}.nc")})
+    members[1]['products'] = ('not a product',)
+
+    # Act
+    results = run_ensemble(members, max_workers=2, numba_threads=1)
+
+    # Assert
+    assert [result['index'] for result in results] == [0, 1, 2]
+    assert results[1]['error'] is not None
+    for i in (0, 2):
+        assert results[i]['error'] is None
+        ncdf = netcdf_file(results[i]['file'], mode='r', mmap=False)
+        assert ncdf.variables['T'].shape == (3,)
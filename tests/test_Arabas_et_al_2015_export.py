@@ -2,9 +2,13 @@ from PySDM_examples.Arabas_et_al_2015.netcdf_exporter import NetCDFExporter
 from PySDM_examples.Arabas_et_al_2015.storage import Storage
 from PySDM_examples.Arabas_et_al_2015.demo_settings import DemoSettings
 from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.output_policy import OutputPolicy, output_policy
 from PySDM_examples.utils.temporary_file import TemporaryFile
 from PySDM_examples.utils.widgets import IntSlider
 from PySDM.backends import CPU
+from scipy.io.netcdf import netcdf_file
+import numpy as np
+import pytest
 
 
 def test_Arabas_et_al_2015_export():
@@ -21,6 +25,35 @@ def test_Arabas_et_al_2015_export():
     file = TemporaryFile()
     exporter = NetCDFExporter(storage=storage, settings=settings, simulator=simulator, filename=file.absolute_path)
 
+    # Act
+    simulator.reinit()
+    simulator.run()
+    exporter.run()
+
+    # Assert
+    ncdf = netcdf_file(file.absolute_path, mode='r', mmap=False)
+    np.testing.assert_array_equal(ncdf.variables['T'][:], np.asarray(settings.output_steps) * settings.dt)
+    for name in simulator.products.keys():
+        assert name in ncdf.variables
+        steps = output_policy(settings, name).steps(settings.output_steps)
+        assert ncdf.variables[name].shape[0] == len(steps)
+
+
+def test_Arabas_et_al_2015_streaming_export():
+    # Arrange
+    settings = DemoSettings()
+    settings.ui_simulation_time = IntSlider(value=20)
+    settings.ui_dt = IntSlider(value=10)
+    settings.output_interval = settings.ui_dt.value
+
+    storage = Storage()
+    simulator = Simulation(settings=settings, storage=storage, backend=CPU)
+    files = {'streamed': TemporaryFile('.nc'), 'exported': TemporaryFile('.nc')}
+    streamer = NetCDFExporter(storage=storage, settings=settings, simulator=simulator,
+                              filename=files['streamed'].absolute_path)
+    simulator.sinks.append(streamer)
+    exporter = NetCDFExporter(storage=storage, settings=settings, simulator=simulator,
+                              filename=files['exported'].absolute_path)
 
     # Act
     simulator.reinit()
@@ -28,4 +61,80 @@ def test_Arabas_et_al_2015_export():
     exporter.run()
 
     # Assert
+    assert streamer.complete
+    streamed = netcdf_file(files['streamed'].absolute_path, mode='r', mmap=False)
+    exported = netcdf_file(files['exported'].absolute_path, mode='r', mmap=False)
+    assert streamed.variables.keys() == exported.variables.keys()
+    for name in exported.variables.keys():
+        np.testing.assert_array_equal(streamed.variables[name][:], exported.variables[name][:])
+
+
+def test_Arabas_et_al_2015_netcdf4_export():
+    # Arrange
+    netCDF4 = pytest.importorskip('netCDF4')
+    settings = DemoSettings()
+    settings.ui_simulation_time = IntSlider(value=10)
+    settings.ui_dt = IntSlider(value=10)
+    settings.output_interval = settings.ui_dt.value
+
+    storage = Storage()
+    simulator = Simulation(settings=settings, storage=storage, backend=CPU)
+    files = {'classic': TemporaryFile('.nc'), 'netcdf4': TemporaryFile('.nc')}
+    exporters = {
+        'classic': NetCDFExporter(storage=storage, settings=settings, simulator=simulator,
+                                  filename=files['classic'].absolute_path),
+        'netcdf4': NetCDFExporter(storage=storage, settings=settings, simulator=simulator,
+                                  filename=files['netcdf4'].absolute_path, netcdf4=True)
+    }
+
+    # Act
+    simulator.reinit()
+    simulator.run()
+    for exporter in exporters.values():
+        exporter.run()
+
+    # Assert
+    classic = netcdf_file(files['classic'].absolute_path, mode='r', mmap=False)
+    with netCDF4.Dataset(files['netcdf4'].absolute_path) as compressed:
+        assert compressed.getncattr('dt') == settings.dt
+        assert 'output_policies' not in compressed.ncattrs()
+        assert not any(attribute.startswith('_') for attribute in compressed.ncattrs())
+        for name in classic.variables.keys():
+            np.testing.assert_array_equal(compressed.variables[name][:], classic.variables[name][:])
+            if len(compressed.variables[name].dimensions) > 1:
+                assert compressed.variables[name].chunking()[0] == 1
+                assert compressed.variables[name].filters()['zlib']
+
 
+def test_Arabas_et_al_2015_export_with_output_policies():
+    # Arrange
+    settings = DemoSettings()
+    settings.ui_simulation_time = IntSlider(value=30)
+    settings.ui_dt = IntSlider(value=10)
+    settings.output_interval = settings.ui_dt.value
+    settings.output_policies = {
+        'Particles Wet Size Spectrum': OutputPolicy(stride=2, window=(slice(0, 5), slice(2, 4))),
+        'RH_env': OutputPolicy(window=(slice(1, None), slice(None))),
+        'wall_time': OutputPolicy(stride=3)
+    }
+
+    storage = Storage(memmap=True)
+    simulator = Simulation(settings=settings, storage=storage, backend=CPU)
+    file = TemporaryFile('.nc')
+    exporter = NetCDFExporter(storage=storage, settings=settings, simulator=simulator, filename=file.absolute_path)
+
+    # Act
+    simulator.reinit()
+    simulator.run()
+    exporter.run()
+
+    # Assert
+    ncdf = netcdf_file(file.absolute_path, mode='r', mmap=False)
+    nx, nz = settings.grid
+    assert ncdf.variables['Particles Wet Size Spectrum'].shape == (2, 5, 2, len(settings.v_bins) - 1)
+    assert ncdf.variables['RH_env'].shape == (4, nx - 1, nz)
+    assert ncdf.variables['wall_time'].shape == (2,)
+    np.testing.assert_array_equal(ncdf.variables['T_2'][:], (0, 20))
+    np.testing.assert_array_equal(
+        ncdf.variables['RH_env'][-1], storage.load('RH_env', settings.output_steps[-1])
+    )
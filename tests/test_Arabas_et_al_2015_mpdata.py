@@ -0,0 +1,53 @@
+from PySDM_examples.Arabas_et_al_2015.mpdata import MPDATA
+from PySDM_examples.Arabas_et_al_2015.thread_budget import threadsafe_layer
+from PySDM.backends.numba import conf
+from types import SimpleNamespace
+import numpy as np
+import numba
+import pytest
+
+
+@pytest.mark.skipif(not threadsafe_layer(), reason="neither tbb nor omp numba threading layer available")
+def test_concurrent_advectees_match_sequential():
+    # Arrange
+    grid = (8, 6)
+    fields = SimpleNamespace(
+        g_factor=np.ones(grid),
+        advector=(np.full((grid[0] + 1, grid[1]), .25), np.full((grid[0], grid[1] + 1), -.1)),
+        advectees={'th': 300., 'qv': .01}
+    )
+    solvers = {concurrent: MPDATA(fields=fields, concurrent=concurrent) for concurrent in (False, True)}
+    for solver in solvers.values():
+        for k, mean in fields.advectees.items():
+            solver[k].advectee.get()[:] = mean * (1 + .1 * np.random.default_rng(seed=44).uniform(size=grid))
+
+    # Act
+    for _ in range(5):
+        for solver in solvers.values():
+            solver()
+            solver.wait()
+
+    # Assert
+    assert solvers[True].executor is not None
+    for k in fields.advectees:
+        np.testing.assert_array_equal(solvers[False][k].advectee.get(), solvers[True][k].advectee.get())
+
+
+def test_concurrent_advectees_share_numba_threads():
+    # Arrange
+    grid = (8, 6)
+    fields = SimpleNamespace(
+        g_factor=np.ones(grid),
+        advector=(np.zeros((grid[0] + 1, grid[1])), np.zeros((grid[0], grid[1] + 1))),
+        advectees={'th': 300., 'qv': .01}
+    )
+
+    # Act
+    solvers = {concurrent: MPDATA(fields=fields, concurrent=concurrent) for concurrent in (False, True)}
+
+    # Assert
+    if conf.JIT_FLAGS['parallel']:
+        assert solvers[False].n_threads == numba.get_num_threads()
+        assert solvers[True].n_threads == max(1, numba.get_num_threads() // 2)
+    else:
+        assert solvers[False].n_threads == solvers[True].n_threads == 1
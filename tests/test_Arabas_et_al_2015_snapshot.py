@@ -0,0 +1,64 @@
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM_examples.Arabas_et_al_2015.snapshot import SnapshotCache, spin_up_key
+from PySDM.backends import CPU
+import numpy as np
+import pytest
+
+
+def make_settings():
+    settings = Settings()
+    settings.grid = (10, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 6 * settings.dt
+    settings.output_interval = 2 * settings.dt
+    settings.spin_up_time = 2 * settings.dt
+    settings.condensation_adaptive = False
+    settings.processes['coalescence'] = False  # stochastic
+    return settings
+
+
+@pytest.mark.parametrize("adaptive", (False, True))
+def test_fork_from_post_spin_up_snapshot(tmp_path, adaptive):
+    # Arrange
+    settings = make_settings()
+    settings.condensation_adaptive = adaptive
+    snapshots = SnapshotCache(tmp_path)
+    storages = {'spun up': Storage(), 'forked': Storage()}
+
+    # Act
+    for key, storage in storages.items():
+        cache = SnapshotCache(tmp_path) if key == 'forked' else snapshots  # fresh cache reading from disk
+        simulation = Simulation(settings, storage, CPU, snapshots=cache)
+        simulation.reinit()
+        simulation.run()
+
+    # Assert
+    assert len(snapshots) == 1
+    assert sorted(simulation.replay.keys()) == [0, 2]
+    for name, product in simulation.products.items():
+        if product.shape == () or 'time' in name:
+            continue
+        for step in settings.output_steps:
+            np.testing.assert_allclose(storages['forked'].load(name, step), storages['spun up'].load(name, step),
+                                       rtol=1e-6, atol=1e-12)
+    assert np.all(np.isnan(storages['forked'].load('wall_time')[:2]))
+    assert not np.any(np.isnan(storages['forked'].load('wall_time')[2:]))
+    assert not np.any(np.isnan(storages['spun up'].load('wall_time')))
+
+
+def test_spin_up_key_ignores_coalescence_settings():
+    # Arrange
+    settings = make_settings()
+    other = make_settings()
+    other.coalescence_adaptive = not settings.coalescence_adaptive
+    other.processes['coalescence'] = True
+
+    # Act
+    keys = [spin_up_key(s, (), CPU) for s in (settings, other)]
+    other.condensation_rtol_x /= 2
+
+    # Assert
+    assert keys[0] == keys[1]
+    assert spin_up_key(other, (), CPU) != keys[0]
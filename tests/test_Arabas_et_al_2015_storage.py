@@ -0,0 +1,246 @@
+from PySDM_examples.Arabas_et_al_2015.storage import Storage, StorageReader
+from PySDM_examples.Arabas_et_al_2015.async_storage import AsyncStorage
+from PySDM_examples.Arabas_et_al_2015.codec import ErrorBoundedCodec
+from PySDM_examples.Arabas_et_al_2015.output_policy import OutputPolicy
+import numpy as np
+import pytest
+
+
+class DummySettings:
+    grid = (3, 2)
+    output_steps = np.arange(0, 4)
+
+
+def test_timeseries_append_and_load_tail():
+    # Arrange
+    storage = Storage()
+    storage.init(DummySettings())
+
+    # Act
+    for step in range(2 * len(DummySettings.output_steps)):
+        storage.save(float(step), step, 'wall_time')
+
+    # Assert
+    np.testing.assert_array_equal(storage.load('wall_time'), np.arange(8))
+    np.testing.assert_array_equal(storage.load_tail('wall_time', 6), (6, 7))
+    with pytest.raises(ValueError):
+        storage.load('wall_time')[0] = 44
+
+
+def test_timeseries_restarts_at_step_zero():
+    # Arrange
+    storage = Storage()
+    storage.init(DummySettings())
+    storage.save(1., 0, 'surf_precip')
+    storage.save(2., 1, 'surf_precip')
+
+    # Act
+    storage.save(3., 0, 'surf_precip')
+
+    # Assert
+    np.testing.assert_array_equal(storage.load('surf_precip'), (3,))
+
+
+def test_timeseries_readable_from_another_storage_instance(tmp_path):
+    # Arrange
+    writer = Storage(path=tmp_path)
+    writer.init(DummySettings())
+    for step in range(3):
+        writer.save(float(step), step, 'surf_precip')
+
+    # Act
+    reader = Storage(path=tmp_path)
+
+    # Assert
+    np.testing.assert_array_equal(reader.load('surf_precip'), (0, 1, 2))
+    np.testing.assert_array_equal(reader.load_tail('surf_precip', 1), (1, 2))
+
+
+@pytest.mark.parametrize("shape", ((3, 2), (3, 2, 5)))
+def test_memmap_fields(shape):
+    # Arrange
+    storage = Storage(memmap=True)
+    storage.init(DummySettings())
+    data = np.arange(np.prod(shape)).reshape(shape)
+
+    # Act
+    storage.save(data, 2, 'field')
+
+    # Assert
+    np.testing.assert_array_equal(storage.load('field', 2), data)
+    assert isinstance(storage.load('field', 2), np.memmap)
+    with pytest.raises(ValueError):
+        storage.load('field', 2)[0] = 44
+    with pytest.raises(Storage.Exception):
+        storage.load('field', 1)
+    with pytest.raises(Storage.Exception):
+        storage.load('other', 2)
+
+
+def test_async_storage_writes_snapshots():
+    # Arrange
+    storage = AsyncStorage(Storage(memmap=True), queue_size=1)
+    storage.init(DummySettings())
+    data = np.zeros(DummySettings.grid)
+
+    # Act
+    for step in DummySettings.output_steps:
+        data[:] = step
+        storage.save(data, step, 'field')
+        storage.save(float(step), step, 'wall_time')
+    storage.flush()
+
+    # Assert
+    for step in DummySettings.output_steps:
+        np.testing.assert_array_equal(storage.load('field', step), step)
+    np.testing.assert_array_equal(storage.load('wall_time'), DummySettings.output_steps)
+    assert storage.io_time > 0
+    assert storage.overlapped_time <= storage.io_time
+
+
+
+class _FailingStorage(Storage):
+    def __init__(self):
+        super().__init__()
+        self.fail = True
+
+    def save(self, data, step, name):
+        if self.fail:
+            self.fail = False
+            raise IOError()
+        super().save(data, step, name)
+
+
+def test_async_storage_recovers_after_failed_write():
+    # Arrange
+    storage = AsyncStorage(_FailingStorage())
+    storage.init(DummySettings())
+    storage.save(0., 0, 'wall_time')
+    with pytest.raises(IOError):
+        storage.flush()
+
+    # Act
+    storage.init(DummySettings())
+    storage.save(1., 0, 'wall_time')
+    storage.flush()
+
+    # Assert
+    np.testing.assert_array_equal(storage.load('wall_time'), [1.])
+    with pytest.raises(RuntimeError):
+        storage.save(2., 1, 'wall_time')
+
+
+@pytest.mark.parametrize("offset", (0, -.5))
+def test_codec_bounds_relative_error(offset):
+    # Arrange
+    rtol = 1e-3
+    codec = ErrorBoundedCodec(rtol=rtol, keyframe_interval=3)
+    storage = Storage(codec=codec)
+    storage.init(DummySettings())
+    rng = np.random.default_rng(seed=44)
+    data = {step: rng.uniform(size=(*DummySettings.grid, 5)) + offset for step in DummySettings.output_steps}
+    data[0][0, 0, 0] = 0
+    data[1][1, 1, 1] = np.nan
+
+    # Act
+    for step, field in data.items():
+        storage.save(field, step, 'spectrum')
+
+    # Assert
+    for step in (3, 0, 1, 2, 3):
+        loaded = storage.load('spectrum', step)
+        finite = np.isfinite(data[step])
+        np.testing.assert_array_equal(finite, np.isfinite(loaded))
+        scale = np.abs(data[step][finite]) if offset == 0 else np.amax(np.abs(data[step][finite]))
+        assert np.all(np.abs(loaded[finite] - data[step][finite]) <= rtol * scale * (1 + 1e-6) + 1e-7)
+    assert storage.load('spectrum', 0)[0, 0, 0] == 0
+    assert codec.report()['spectrum']['max_relative_error'] <= rtol
+
+
+def test_output_policy_stride_and_window():
+    # Arrange
+    settings = DummySettings()
+    settings.output_policies = {
+        'field': OutputPolicy(stride=2, window=(slice(1, 3), slice(0, 1))),
+        'wall_time': OutputPolicy(stride=3)
+    }
+    storage = Storage(memmap=True)
+    storage.init(settings)
+    field = np.arange(np.prod(DummySettings.grid)).reshape(DummySettings.grid)
+
+    # Act
+    for index, step in enumerate(settings.output_steps):
+        for name, data in {'field': field, 'wall_time': float(step)}.items():
+            policy = settings.output_policies[name]
+            if policy.stores(index):
+                storage.save(policy.crop(data), step, name)
+
+    # Assert
+    assert storage.fields['field'].shape == (2, 2, 1)
+    np.testing.assert_array_equal(storage.load('field', 2), field[1:3, 0:1])
+    with pytest.raises(Storage.Exception):
+        storage.load('field', 1)
+    np.testing.assert_array_equal(storage.load('wall_time'), (0, 3))
+    uncropped = settings.output_policies['field'].uncrop(storage.load('field', 2), DummySettings.grid)
+    assert np.isnan(uncropped[0, 0]) and uncropped[1, 0] == field[1, 0]
+
+
+@pytest.mark.parametrize("memmap", (True, False))
+def test_reader_follows_committed_steps(tmp_path, memmap):
+    # Arrange
+    writer = Storage(path=tmp_path, memmap=memmap)
+    writer.init(DummySettings())
+    reader = StorageReader(tmp_path)
+    data = np.zeros(DummySettings.grid)
+
+    for step in DummySettings.output_steps:
+        # Act
+        data[:] = step
+        writer.save(data, step, 'field')
+        writer.save(float(step), step, 'surf_precip')
+
+        # Assert
+        assert not reader.available('field', step)
+        assert len(reader.load_tail('surf_precip')) == step
+
+        # Act
+        writer.commit(step)
+
+        # Assert
+        assert reader.available('field', step)
+        np.testing.assert_array_equal(reader.load('field', step), step)
+        np.testing.assert_array_equal(reader.load_tail('surf_precip'), np.arange(step + 1))
+
+    # Act
+    writer.init(DummySettings())
+
+    # Assert
+    assert not reader.available('field', 0)
+    with pytest.raises(Storage.Exception):
+        reader.load('field', 0)
+    with pytest.raises(NotImplementedError):
+        reader.save(data, 0, 'field')
+
+
+def test_commit_rewrites_only_step_counter(tmp_path):
+    # Arrange
+    storage = Storage(path=tmp_path)
+    storage.init(DummySettings())
+    storage.save(np.zeros(DummySettings.grid), 0, 'field')
+    storage.save(0., 0, 'surf_precip')
+    storage.commit(0)
+    products = (tmp_path / 'products.json').stat()
+    manifest_size = (tmp_path / 'manifest.json').stat().st_size
+
+    # Act
+    for step in DummySettings.output_steps[1:]:
+        storage.save(np.zeros(DummySettings.grid), step, 'field')
+        storage.save(float(step), step, 'surf_precip')
+        storage.commit(step)
+    storage.flush()
+
+    # Assert
+    assert (tmp_path / 'products.json').stat().st_ino == products.st_ino
+    assert (tmp_path / 'manifest.json').stat().st_size == manifest_size
+    assert storage.timeseries['surf_precip'].file is None
+    np.testing.assert_array_equal(StorageReader(tmp_path).load_tail('surf_precip'), DummySettings.output_steps)
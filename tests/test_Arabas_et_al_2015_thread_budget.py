@@ -0,0 +1,49 @@
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM_examples.Arabas_et_al_2015.thread_budget import ThreadBudget, threadsafe_layer
+from PySDM.backends import CPU
+import numba
+import pytest
+
+
+def test_adaptive_split_moves_threads_towards_slower_side():
+    # Arrange
+    budget = ThreadBudget(n_threads=8, advection_share=.25, adaptive=True)
+
+    # Act
+    splits = [budget.advection_threads]
+    for advection_time, particle_time in ((2, 1), (2, 1), (1, 1.05), (1, 3)):
+        budget.rebalance(advection_time, particle_time)
+        splits.append(budget.advection_threads)
+
+    # Assert
+    assert splits == [2, 3, 4, 4, 3]
+    assert budget.particle_threads == 5
+    assert len(budget.history) == 4
+
+
+@pytest.mark.skipif(not threadsafe_layer(), reason="neither tbb nor omp numba threading layer available")
+@pytest.mark.parametrize("adaptive", (False, True))
+def test_budgeted_asynchronous_run(adaptive):
+    # Arrange
+    settings = Settings()
+    settings.grid = (10, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 4 * settings.dt
+    settings.output_interval = settings.dt
+    settings.spin_up_time = settings.dt
+    settings.mpdata_asynchronous = True
+    settings.threads_advection_share = .5
+    settings.threads_adaptive = adaptive
+    threads = numba.get_num_threads()
+    simulation = Simulation(settings, Storage(), CPU)
+
+    # Act
+    simulation.reinit()
+    simulation.run()
+
+    # Assert
+    assert simulation.thread_budget is not None
+    assert len(simulation.thread_budget.history) == len(settings.output_steps)
+    assert numba.get_num_threads() == threads
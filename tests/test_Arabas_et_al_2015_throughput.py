@@ -0,0 +1,64 @@
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM_examples.Arabas_et_al_2015.dummy_controller import DummyController
+from PySDM_examples.utils.throughput import ThroughputMeter
+from PySDM.backends import CPU
+import json
+import io
+
+
+def test_meter_derives_steps_from_fraction(tmp_path):
+    # Arrange
+    sink = tmp_path / 'metrics.jsonl'
+    meter = ThroughputMeter(sink, label='test')
+    meter.configure(n_sd=10, n_steps=100)
+    meter.start()
+
+    # Act
+    for fraction in (0, .5, 1):
+        meter.update(fraction)
+
+    # Assert
+    records = [json.loads(line) for line in sink.read_text().splitlines()]
+    assert [record['steps'] for record in records] == [0, 50, 100]
+    assert records[-1]['eta'] == 0
+    assert records[-1]['label'] == 'test'
+    assert records[-1]['compute_time'] is None
+
+
+class EagerController(DummyController):
+    """ reports progress already on entering (as `DemoController` does) """
+
+    def __enter__(self):
+        super().__enter__()
+        self.set_percent(0)
+
+
+def test_simulation_reports_throughput():
+    # Arrange
+    settings = Settings()
+    settings.grid = (10, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 4 * settings.dt
+    settings.output_interval = settings.dt
+    settings.spin_up_time = settings.dt
+    simulation = Simulation(settings, Storage(), CPU)
+    sink = io.StringIO()
+
+    # Act
+    simulation.reinit()
+    simulation.run(EagerController(metrics=sink))
+
+    # Assert
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert len(records) == len(settings.output_steps) + 1
+    assert records[0]['steps'] == 0
+    assert records[0]['sd_steps_per_second'] == 0
+    assert records[-1]['eta'] == 0
+    assert records[-1]['steps'] == settings.output_steps[-1]
+    assert records[-1]['fraction'] == 1
+    assert records[-1]['compute_time'] > 0
+    assert 0 < records[-1]['storage_fraction'] < 1
+    for record in records[1:]:
+        assert record['sd_steps_per_second'] == settings.n_sd * record['steps_per_second']
@@ -0,0 +1,50 @@
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM.backends import CPU
+import numpy as np
+
+
+class SummaryController:
+    def __init__(self):
+        self.panic = False
+        self.tables = []
+
+    def set_percent(self, value):
+        pass
+
+    def summary(self, table):
+        self.tables.append(table)
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *_):
+        pass
+
+
+def test_per_dynamic_wall_time_products_and_summary():
+    # Arrange
+    settings = Settings()
+    settings.grid = (10, 8)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 4 * settings.dt
+    settings.output_interval = settings.dt
+    settings.spin_up_time = settings.dt
+    storage = Storage()
+    simulation = Simulation(settings, storage, CPU)
+    controller = SummaryController()
+
+    # Act
+    simulation.reinit()
+    simulation.run(controller)
+
+    # Assert
+    assert simulation.dynamic_times.steps == settings.output_steps[-1]
+    for name in simulation.core.dynamics:
+        assert f'{name}_wall_time' in simulation.products
+        assert f'{name:>24}' in simulation.timing_summary
+        assert simulation.dynamic_times.time[name] > 0
+    per_substep = storage.load('Condensation_wall_time_per_substep')
+    assert np.all(per_substep[1:] > 0)
+    assert controller.tables == [simulation.timing_summary]
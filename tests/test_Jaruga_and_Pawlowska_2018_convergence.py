@@ -0,0 +1,53 @@
+from PySDM_examples.Jaruga_and_Pawlowska_2018.convergence import convergence_sweep, cost_vs_accuracy, warm_up_run
+
+
+class FakeSimulation:
+    def __init__(self, n_sd):
+        self.n_sd = n_sd
+
+    def run(self):
+        return {'S_max': [1 + 1 / self.n_sd ** 2]}
+
+
+def test_sweep_stops_once_converged():
+    # Arrange
+    n_sds = [1, 2, 4, 8, 16, 32]
+
+    # Act
+    runs = convergence_sweep(lambda n_sd: n_sd, n_sds, diagnostics={'S_max': lambda output: output['S_max'][0]},
+                             rtol=.05, simulation_class=FakeSimulation)
+
+    # Assert
+    assert [run['n_sd'] for run in runs] == [1, 2, 4, 8]
+    assert runs[0]['change'] is None
+    assert [run['converged'] for run in runs] == [False, False, False, True]
+    assert len(cost_vs_accuracy(runs).splitlines()) == len(runs) + 1
+
+
+class FakeCore:
+    def __init__(self):
+        self.n_steps = 0
+        self.products = {}
+
+    def run(self, steps):
+        self.n_steps += steps
+
+
+class FakeCoreSimulation(FakeSimulation):
+    def __init__(self, n_sd):
+        super().__init__(n_sd)
+        self.core = FakeCore()
+
+    def run(self):
+        raise AssertionError("warm-up should not run the whole simulation")
+
+
+def test_warm_up_advances_one_step():
+    # Arrange
+    simulation = FakeCoreSimulation(n_sd=1)
+
+    # Act
+    warm_up_run(simulation)
+
+    # Assert
+    assert simulation.core.n_steps == 1
@@ -0,0 +1,44 @@
+from PySDM_examples.Shima_et_al_2009.settings import Settings
+from PySDM_examples.Shima_et_al_2009.replicas import run_replicas
+from PySDM_examples.utils.ensemble_statistics import EnsembleStatistics
+import numpy as np
+
+
+def test_replicas_evolve_independently():
+    # Arrange
+    settings = Settings()
+    settings.n_sd = 2 ** 10
+    settings._steps = [0, 600]
+    n_replicas = 3
+
+    # Act
+    states, exec_time = run_replicas(settings, n_replicas=n_replicas)
+
+    # Assert
+    assert exec_time > 0
+    initial, final = states[0], states[settings.output_steps[-1]]
+    assert initial.shape == final.shape == (n_replicas, len(settings.radius_bins_edges) - 1)
+    for replica in range(1, n_replicas):
+        np.testing.assert_allclose(initial[replica], initial[0])
+        assert not np.allclose(final[replica], final[0])
+    dlnr = np.diff(np.log(settings.radius_bins_edges))
+    np.testing.assert_allclose(np.sum(final * dlnr, axis=1), np.sum(initial * dlnr, axis=1), rtol=1e-2)
+
+
+def test_replicas_streamed_into_statistics():
+    # Arrange
+    settings = Settings()
+    settings.n_sd = 2 ** 10
+    settings._steps = [0, 600]
+    n_replicas = 3
+    statistics = EnsembleStatistics()
+
+    # Act
+    states, _ = run_replicas(settings, n_replicas=n_replicas, sink=statistics)
+
+    # Assert
+    assert states == {}
+    assert statistics.steps('dv/dlnr') == list(settings.output_steps)
+    for step in settings.output_steps:
+        assert statistics.count('dv/dlnr', step) == n_replicas
+        assert statistics.mean('dv/dlnr', step).shape == (len(settings.radius_bins_edges) - 1,)
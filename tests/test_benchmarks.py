@@ -0,0 +1,129 @@
+from PySDM_examples.benchmarks import CASES, measure, compare, scaling, scaling_table
+from PySDM_examples.benchmarks.suite import confidence_interval
+from PySDM_examples.benchmarks.isolated import configurations, run_isolated
+from PySDM_examples.benchmarks import __main__ as command_line
+import numpy as np
+import pytest
+
+
+def result(mean, spread, size=64):
+    return {'case': 'box_coalescence', 'size': size, 'mean': mean, 'ci95': [mean - spread, mean + spread]}
+
+
+def test_measure_box_coalescence():
+    # Act
+    measurement = measure(CASES['box_coalescence'], 2 ** 10, repeats=2)
+
+    # Assert
+    assert len(measurement['run_time']) == len(measurement['setup_time']) == 2
+    assert measurement['ci95'][0] <= measurement['mean'] <= measurement['ci95'][1]
+    assert measurement['compile_time'] >= 0
+    assert measurement['sd_steps_per_second'] > 0
+
+
+def test_measure_requires_a_repeat():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        measure(CASES['box_coalescence'], 2 ** 10, repeats=0)
+
+
+def test_confidence_interval_narrows_with_more_samples():
+    # Arrange
+    rng = np.random.default_rng(seed=44)
+    samples = rng.normal(loc=1, scale=.1, size=100)
+
+    # Act
+    few, many = confidence_interval(samples[:5]), confidence_interval(samples)
+
+    # Assert
+    assert few[0] < 1 < few[1]
+    assert many[1] - many[0] < few[1] - few[0]
+
+
+def test_compare_flags_significant_slowdowns_only():
+    # Arrange
+    baseline = {'results': [result(1., .01), result(2., .01, size=128)]}
+    current = {'results': [result(1.5, .01), result(2.1, .5, size=128), result(9., .01, size=256)]}
+
+    # Act
+    regressions = compare(baseline, current, threshold=.1)
+
+    # Assert
+    assert [(r['size'], r['ratio']) for r in regressions] == [(64, 1.5)]
+
+
+def test_isolated_run_reports_over_pipe():
+    # Arrange
+    configuration, = configurations(['box_coalescence'], sizes={'box_coalescence': (2 ** 10,)},
+                                    thread_counts=(1,), repeats=2)
+
+    # Act
+    result = run_isolated(configuration)
+
+    # Assert
+    assert 'error' not in result, result.get('error')
+    assert result['configuration'] == configuration
+    assert result['metadata']['numba_threads'] == 1
+    assert len(result['run_time']) == 2
+
+
+def test_isolated_run_presets_parallel_mode():
+    # Arrange
+    configuration, = configurations(['box_coalescence'], sizes={'box_coalescence': (2 ** 10,)},
+                                    parallel_modes=(False,), repeats=1)
+
+    # Act
+    result = run_isolated(configuration)
+
+    # Assert
+    assert 'error' not in result, result.get('error')
+    assert result['metadata']['parallel'] is False
+    assert result['metadata']['jit_parallel'] is False
+
+
+def test_matrix_command_parses_parallel_modes(monkeypatch, tmp_path):
+    # Arrange
+    measured = []
+
+    def run_matrix(configs, timeout):
+        measured.extend(configs)
+        return {'metadata': {}, 'results': [], 'errors': []}
+
+    monkeypatch.setattr(command_line, 'run_matrix', run_matrix)
+
+    # Act
+    status = command_line.main(['matrix', '--cases', 'box_coalescence', '--parallel', 'False', 'sync', 'async',
+                                '--output', str(tmp_path / 'benchmark.json')])
+
+    # Assert
+    assert status == 0
+    assert [configuration['parallel'] for configuration in measured[:3]] == [False, 'sync', 'async']
+
+
+def test_matrix_command_rejects_unknown_parallel_mode():
+    # Act & Assert
+    with pytest.raises(SystemExit):
+        command_line.main(['matrix', '--parallel', 'fast'])
+
+
+def test_strong_scaling_reports_efficiency_per_dynamic():
+    # Act
+    results = scaling('box_coalescence', size=2 ** 12, thread_counts=(1, 1), repeats=1)
+
+    # Assert
+    assert [result['threads'] for result in results] == [1, 1]
+    assert set(results[0]['time']) == {'total', 'Coalescence'}
+    assert results[0]['efficiency']['total'] == 1
+    assert len(scaling_table(results).splitlines()) == 3
+
+
+def test_kinematic_case_runs_silently(capsys):
+    # Arrange
+    run, _, core = CASES['kinematic_2d'](1)
+
+    # Act
+    run()
+
+    # Assert
+    assert core.n_steps > 0
+    assert capsys.readouterr().out == ''
@@ -0,0 +1,31 @@
+from PySDM_examples.utils.ensemble_statistics import EnsembleStatistics
+import numpy as np
+
+
+def test_ensemble_statistics_match_numpy(tmp_path):
+    # Arrange
+    rng = np.random.default_rng(seed=44)
+    members = rng.uniform(size=(7, 3, 2, 5))
+    statistics = EnsembleStatistics()
+    halves = (EnsembleStatistics(), EnsembleStatistics())
+
+    # Act
+    for i, member in enumerate(members):
+        for step in (0, 10):
+            statistics.save(member + step, step, 'spectrum')
+            halves[i % 2].save(member + step, step, 'spectrum')
+        statistics.save(float(member[0, 0, 0]), 10, 'surf_precip')
+    halves[0].merge(halves[1])
+    statistics.write(tmp_path / 'statistics.npz')
+
+    # Assert
+    for stats in (statistics, halves[0]):
+        assert stats.steps('spectrum') == [0, 10]
+        assert stats.count('spectrum', 10) == len(members)
+        np.testing.assert_allclose(stats.mean('spectrum', 10), np.mean(members, axis=0) + 10)
+        np.testing.assert_allclose(stats.variance('spectrum', 0), np.var(members, axis=0, ddof=1))
+        np.testing.assert_array_equal(stats.min('spectrum', 0), np.amin(members, axis=0))
+        np.testing.assert_array_equal(stats.max('spectrum', 0), np.amax(members, axis=0))
+    np.testing.assert_allclose(statistics.mean('surf_precip', 10), np.mean(members[:, 0, 0, 0]))
+    with np.load(tmp_path / 'statistics.npz') as saved:
+        np.testing.assert_allclose(saved['spectrum/0/mean'], np.mean(members, axis=0))
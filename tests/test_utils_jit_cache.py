@@ -0,0 +1,99 @@
+from PySDM_examples.utils.jit_cache import cached_stepper, enable_jit_cache, _dispatchers
+from PySDM_examples.Arabas_et_al_2015.settings import Settings
+from PySDM_examples.Arabas_et_al_2015.simulation import Simulation, warmup
+from PySDM_examples.Arabas_et_al_2015.storage import Storage
+from PySDM.backends import CPU
+from numba.core.caching import NullCache
+import subprocess
+import os
+import sys
+
+
+def _n_compiled():
+    """ number of compiled signatures of all imported PySDM and example kernels """
+    return sum(
+        len(dispatcher.overloads)
+        for name, module in tuple(sys.modules.items())
+        if module is not None and name.startswith(('PySDM.', 'PySDM_examples.'))
+        for dispatcher in _dispatchers(vars(module).values())
+    )
+
+
+def _settings():
+    settings = Settings()
+    settings.grid = (6, 4)
+    settings.n_sd_per_gridbox = 4
+    settings.simulation_time = 4 * settings.dt
+    settings.output_interval = settings.dt
+    settings.spin_up_time = settings.dt
+    return settings
+
+
+def test_cached_stepper_reused_for_equal_arguments():
+    # Arrange
+    options = {'n_iters': 2, 'infinite_gauge': True}
+
+    # Act
+    first = cached_stepper(options, grid=(4, 3), non_unit_g_factor=True)
+    second = cached_stepper(dict(reversed(tuple(options.items()))), grid=[4, 3], non_unit_g_factor=True)
+    other = cached_stepper(options, grid=(5, 3), non_unit_g_factor=True)
+
+    # Assert
+    assert first[1] is second[1]
+    assert other[1] is not first[1]
+    assert first[0].n_iters == 2
+
+
+def test_no_compilation_after_warmup():
+    # Arrange
+    settings = _settings()
+    compile_time = warmup(settings)
+    n_compiled = _n_compiled()
+
+    # Act
+    simulation = Simulation(settings, Storage(), CPU)
+    simulation.reinit()
+    simulation.run()
+
+    # Assert
+    assert compile_time > 0
+    assert _n_compiled() == n_compiled
+
+
+def test_enable_jit_cache_writes_to_cache_dir(tmp_path):
+    # Arrange
+    script = "; ".join((
+        "import sys",
+        "from PySDM_examples.Arabas_et_al_2015.settings import Settings",
+        "from PySDM_examples.Arabas_et_al_2015.simulation import warmup",
+        "from PySDM_examples.utils.jit_cache import enable_jit_cache",
+        "assert enable_jit_cache(sys.argv[1], include_pysdm=True) > 0",
+        "settings = Settings()",
+        "settings.grid = (6, 4)",
+        "warmup(settings)"
+    ))
+
+    # Act
+    subprocess.run([sys.executable, '-c', script, str(tmp_path)], check=True)
+
+    # Assert
+    files = [path.suffix for path in tmp_path.rglob('*') if path.is_file()]
+    assert '.nbi' in files
+    assert '.nbc' in files
+
+
+def test_enable_jit_cache_leaves_pysdm_kernels_and_cache_dir_alone(tmp_path):
+    # Arrange
+    cache_dir = os.environ.get('NUMBA_CACHE_DIR')
+
+    # Act
+    enable_jit_cache(tmp_path)
+
+    # Assert
+    assert os.environ.get('NUMBA_CACHE_DIR') == cache_dir
+    assert all(
+        isinstance(dispatcher._cache, NullCache)
+        for name, module in tuple(sys.modules.items())
+        if module is not None and name.startswith('PySDM.')
+        for dispatcher in _dispatchers(vars(module).values())
+    )
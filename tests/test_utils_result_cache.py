@@ -0,0 +1,143 @@
+from PySDM_examples.utils.result_cache import ResultCache, result_key
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+
+
+class Settings:
+    def __init__(self, n_sd=64, adaptive=False):
+        self.n_sd = n_sd
+        self.adaptive = adaptive
+        self.bins = np.linspace(0, 1, 5)
+
+
+def run(settings, backend='CPU', observers=()):
+    run.calls += 1
+    return {'n_sd': settings.n_sd, 'values': settings.bins * settings.n_sd}
+
+
+run.calls = 0
+
+
+def test_memoized_run_is_loaded_from_disk(tmp_path):
+    # Arrange
+    run.calls = 0
+    cached_run = ResultCache(tmp_path).memoize(run)
+
+    # Act
+    first = cached_run(Settings())
+    second = ResultCache(tmp_path).memoize(run)(Settings(), observers=())
+    other = cached_run(Settings(adaptive=True))
+
+    # Assert
+    assert run.calls == 2
+    np.testing.assert_array_equal(second['values'], first['values'])
+    assert other['n_sd'] == first['n_sd']
+
+
+def test_key_depends_on_settings_values_only():
+    # Arrange
+    settings, same, different = Settings(), Settings(), Settings()
+    different.bins[-1] = 2
+
+    # Act
+    keys = [result_key('label', s) for s in (settings, same, different)]
+
+    # Assert
+    assert keys[0] == keys[1]
+    assert keys[2] != keys[0]
+    assert result_key('other', settings) != keys[0]
+
+
+def test_least_recently_used_results_evicted_and_queryable(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path, max_entries=2)
+    cached_run = cache.memoize(run)
+
+    # Act
+    cached_run(Settings(n_sd=1))
+    cached_run(Settings(n_sd=2))
+    cached_run(Settings(n_sd=1))
+    cached_run(Settings(n_sd=3))
+
+    # Assert
+    assert len(cache) == 2
+    assert sorted(entry['parameters']['n_sd'] for entry in cache.entries().values()) == [1, 3]
+    assert len(cache.entries(n_sd=3, adaptive=False)) == 1
+    assert len(cache.entries(label='other')) == 0
+    assert len(list(tmp_path.glob('*.pkl'))) == 2
+
+
+def test_key_depends_on_captured_and_default_values():
+    # Arrange
+    def scaled(factor):
+        return lambda x: factor * x
+
+    settings = [Settings() for _ in range(4)]
+    settings[0].formula = scaled(1)
+    settings[1].formula = scaled(1)
+    settings[2].formula = scaled(2)
+    settings[3].formula = lambda x, factor=2: factor * x
+
+    # Act
+    keys = [result_key('label', s) for s in settings]
+
+    # Assert
+    assert keys[0] == keys[1]
+    assert len(set(keys[1:])) == 3
+
+
+def test_explicit_default_argument_shares_key(tmp_path):
+    # Arrange
+    run.calls = 0
+    cached_run = ResultCache(tmp_path).memoize(run)
+
+    # Act
+    cached_run(Settings())
+    cached_run(Settings(), backend='CPU')
+
+    # Assert
+    assert run.calls == 1
+
+
+def test_too_deeply_nested_settings_are_not_cached():
+    # Arrange
+    settings = Settings()
+    node = settings
+    for _ in range(16):
+        node.child = Settings()
+        node = node.child
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        result_key('label', settings)
+
+
+def test_observers_bypass_cache(tmp_path):
+    # Arrange
+    run.calls = 0
+    cache = ResultCache(tmp_path)
+    cached_run = cache.memoize(run)
+    cached_run(Settings())
+
+    # Act
+    cached_run(Settings(), observers=(object(),))
+
+    # Assert
+    assert run.calls == 2
+    assert len(cache) == 1
+    assert cache.hits == 0
+
+
+def test_concurrent_puts_keep_all_entries(tmp_path):
+    # Arrange
+    cache = ResultCache(tmp_path)
+    keys = [f"key{i}" for i in range(16)]
+
+    # Act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tuple(executor.map(lambda key: ResultCache(tmp_path).put(key, key), keys))
+
+    # Assert
+    assert sorted(cache.entries()) == sorted(keys)
+    assert not (tmp_path / 'index.lock').exists()